@@ -1,25 +1,57 @@
 from __future__ import annotations
 
+import os
 import requests
 import time
 from typing import List, Dict, Optional
 
-from .constants import NEWSAPI_CATEGORIES
+from .constants import NEWSAPI_BASE_URL, NEWSAPI_CATEGORIES
 from .utils import make_id, norm_time
 
+RETRY_STATUS = (500, 502, 503, 504)
+STOP_STATUS = (401, 426, 429)  # everything: 키 오류 / 플랜 제한 / 쿼터 소진 → 재시도 무의미, 페이지 중단
+RETRIES = 2
+RETRY_BACKOFF = 0.5
+PAGE_DELAY = 0.2  # 페이지 사이 간격 (NewsAPI 부하 완화)
+
+
+def _base_url() -> str:
+    # 로드테스트 등에서 로컬 가짜 서버로 돌릴 수 있게 환경변수로 덮어쓰기 허용
+    return (os.getenv("NEWSAPI_BASE_URL") or NEWSAPI_BASE_URL).rstrip("/")
+
+
+def _get(sess: requests.Session, url: str, params: Dict, debug: bool = False) -> requests.Response:
+    """5xx / 연결 오류는 지수 백오프로 RETRIES 번까지 재시도. 그 외 오류는 HTTPError."""
+    attempt = 0
+    while True:
+        try:
+            r = sess.get(url, params=params, timeout=20)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= RETRIES:
+                raise
+            if debug:
+                print(f"[Retry] {url} attempt={attempt + 1} err={type(e).__name__}")
+        else:
+            if r.status_code not in RETRY_STATUS or attempt >= RETRIES:
+                r.raise_for_status()
+                return r
+            if debug:
+                print(f"[Retry] {url} attempt={attempt + 1} code={r.status_code}")
+        time.sleep(RETRY_BACKOFF * (2 ** attempt))
+        attempt += 1
+
 
 def fetch_top_headlines_category(api_key: str, category: str, country: str = "us",
                                  page_size: int = 100, max_pages: int = 1, debug: bool = False) -> List[Dict]:
     assert category in NEWSAPI_CATEGORIES
-    url = "https://newsapi.org/v2/top-headlines"
+    url = f"{_base_url()}/top-headlines"
     sess = requests.Session()
     items: List[Dict] = []
     page = 1
     while page <= max_pages:
         params = {"apiKey": api_key, "category": category, "country": country,
                   "pageSize": page_size, "page": page}
-        r = sess.get(url, params=params, timeout=20)
-        r.raise_for_status()
+        r = _get(sess, url, params, debug)
         data = r.json()
         if data.get("status") != "ok":
             if debug:
@@ -36,21 +68,21 @@ def fetch_top_headlines_category(api_key: str, category: str, country: str = "us
                 "url": link,
                 "source": (a.get("source") or {}).get("name") or "NewsAPI",
                 "published": norm_time(a.get("publishedAt")),
-                "summary": (a.get("description") or "")[:2000],
+                "summary": a.get("description") or "",
                 "category": category,
                 "raw": a,
             })
         if len(arts) < page_size:
             break
         page += 1
-        time.sleep(0.2)
+        time.sleep(PAGE_DELAY)
     return items
 
 
 def fetch_everything_by_domains(api_key: str, *, domains_csv: str, language: str,
                                 page_size: int = 100, max_pages: int = 1, debug: bool = False,
                                 extra_params: Optional[Dict] = None) -> List[Dict]:
-    url = "https://newsapi.org/v2/everything"
+    url = f"{_base_url()}/everything"
     sess = requests.Session()
     items: List[Dict] = []
     page = 1
@@ -60,13 +92,12 @@ def fetch_everything_by_domains(api_key: str, *, domains_csv: str, language: str
         if extra_params:
             params.update(extra_params)
         try:
-            r = sess.get(url, params=params, timeout=20)
-            r.raise_for_status()
+            r = _get(sess, url, params, debug)
         except requests.HTTPError as e:
             code = getattr(e.response, "status_code", None)
             if debug:
                 print(f"[HTTPError] everything {language} p{page} code={code} msg={e}")
-            if code in (401, 426, 429):
+            if code in STOP_STATUS:
                 break
             raise
         data = r.json()
@@ -85,11 +116,12 @@ def fetch_everything_by_domains(api_key: str, *, domains_csv: str, language: str
                 "url": link,
                 "source": (a.get("source") or {}).get("name") or "NewsAPI",
                 "published": norm_time(a.get("publishedAt")),
-                "summary": (a.get("description") or "")[:2000],
+                "summary": a.get("description") or "",
+                "req_lang": language,
                 "raw": a,
             })
         if len(arts) < page_size:
             break
         page += 1
-        time.sleep(0.2)
+        time.sleep(PAGE_DELAY)
     return items
@@ -3,13 +3,21 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from typing import List
+import sys
+from typing import Dict, List, Optional, Sequence
 
 from news_collector.collector import collect_categories_domains_mode, collect_categories
-from news_collector.constants import NEWSAPI_CATEGORIES
+from news_collector.compact import COMPACT_STORES, VACUUM_MODES, run_compact
+from news_collector.constants import DB_PATH, NEWSAPI_CATEGORIES
+from news_collector.feed import ChangeFeed, FeedStorage, make_server
+from news_collector.images import ImageCache, ImageProber
+from news_collector.profiling import PROFILE_MODES, Profiler
+from news_collector.ranking import Scorer
+from news_collector.spool import Spool, SpoolBusy
+from news_collector.storage import STORES, Storage, open_storage
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Category-based News Collector (NewsAPI) - ko/en domains or top-headlines")
     p.add_argument("--categories", nargs="+", default=NEWSAPI_CATEGORIES)
     p.add_argument("--country", default="us")
@@ -21,37 +29,93 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--debug", action="store_true")
     p.add_argument("--domains-file", help="category->domains JSON. If set, use /v2/everything with languages.")
     p.add_argument("--languages", default="ko,en", help="comma-separated (e.g., ko,en)")
-    p.add_argument("--store", choices=["sqlite", "firestore"], default="sqlite",
-                   help="저장 백엔드 선택 (sqlite|firestore)")
-    return p.parse_args()
+    p.add_argument("--store", choices=STORES, default="sqlite",
+                   help="저장 백엔드 선택 (sqlite|firestore|memory)")
+    p.add_argument("--db", default=DB_PATH, help="sqlite 파일 경로 (--store sqlite)")
+    p.add_argument("--top-k", type=int, help="카테고리별 상위 K 기사 (score 기준)를 저장소에 유지")
+    p.add_argument("--rank-config", help="Scorer 설정 JSON (half_life_hours, source_weights, lang_weights, ...)")
+    p.add_argument("--enrich-images", action="store_true",
+                   help="새 기사의 대표 이미지를 조회해 content type/크기/가로세로/생존 여부 기록")
+    p.add_argument("--image-workers", type=int, default=16)
+    p.add_argument("--image-per-host", type=int, default=4)
+    p.add_argument("--image-cache", help="이미지 메타데이터 캐시 sqlite 파일 (없으면 실행 중 메모리 캐시만)")
+    p.add_argument("--profile", choices=PROFILE_MODES,
+                   help="cpu: cProfile + collapsed stacks, mem: tracemalloc 단계별 top allocations")
+    p.add_argument("--profile-out", default="profile", help="프로파일 결과 디렉터리")
+    p.add_argument("--outbox", help="변경 이벤트(outbox)를 기록할 sqlite 파일. --store sqlite 에서 --db 와 같으면 "
+                                    "저장과 같은 트랜잭션으로 기록 (기본: 기록 안 함)")
+    p.add_argument("--spool-dir", help="저장 전에 기사를 append-only 스풀에 기록 (실패 시 drain 으로 재생)")
 
+    # 서브커맨드에서도 공통 옵션을 받되 default=SUPPRESS 로 둬서, 서브커맨드 앞에 준 값을 기본값으로 덮어쓰지 않게 함
+    sub = p.add_subparsers(dest="command")
+    d = sub.add_parser("drain", help="스풀에 남은 기사를 저장 백엔드로 재생")
+    d.add_argument("--spool-dir", default=argparse.SUPPRESS)
+    d.add_argument("--store", choices=STORES, default=argparse.SUPPRESS)
+    d.add_argument("--db", default=argparse.SUPPRESS)
+    d.add_argument("--batch-size", type=int, default=100)
 
-def main() -> None:
-    args = parse_args()
+    c = sub.add_parser("compact", help="보존 기간이 지난 기사 삭제 / raw_json 제거 / VACUUM")
+    c.add_argument("--store", choices=COMPACT_STORES, default=argparse.SUPPRESS)
+    c.add_argument("--db", default=argparse.SUPPRESS)
+    c.add_argument("--drop-days", type=int, help="N일보다 오래된 기사 삭제")
+    c.add_argument("--strip-days", type=int, help="M일보다 오래된 기사의 raw_json 제거")
+    c.add_argument("--vacuum", choices=VACUUM_MODES, default="incremental",
+                   help="sqlite 전용. incremental: 예산 안에서 빈 페이지 반환, "
+                        "full: 전체 VACUUM (예산 무시, 최초 1회 incremental 로 전환)")
+    c.add_argument("--time-budget", type=float, help="최대 실행 시간(초). 넘으면 다음 실행에서 이어서 처리")
 
-    invalid = [c for c in args.categories if c not in NEWSAPI_CATEGORIES]
-    if invalid:
-        raise ValueError(f"invalid category: {', '.join(invalid)}")
+    s = sub.add_parser("serve", help="outbox 변경 스트림을 HTTP(JSON 폴링 /changes, SSE /stream)로 제공")
+    s.add_argument("--db", default=argparse.SUPPRESS, help="outbox 테이블이 있는 sqlite 파일")
+    s.add_argument("--host", default="127.0.0.1")
+    s.add_argument("--port", type=int, default=8765)
+    s.add_argument("--poll-interval", type=float, default=1.0)
+    args = p.parse_args(argv)
+    if args.command == "drain" and not args.spool_dir:
+        p.error("drain: --spool-dir is required")
+    if args.command == "compact" and args.store not in COMPACT_STORES:
+        p.error(f"compact: --store must be one of {', '.join(COMPACT_STORES)}")
+    return args
 
-    api_key = os.getenv("NEWSAPI_KEY")
-    if not api_key:
-        raise ValueError("NEWSAPI_KEY environment variable not set")
 
-    # 백엔드 선택
-    if args.store == "firestore":
-        try:
-            from news_collector.db_firestore import connect_firestore, save_article as save_backend
-        except ModuleNotFoundError as e:
-            raise RuntimeError(
-                "Firestore backend requires 'firebase-admin' package. Install with: pip install firebase-admin") from e
-        db_conn = connect_firestore()
-    else:
-        from news_collector.db import connect_db, save_article as save_backend
-        db_conn = connect_db()
+def drain(args: argparse.Namespace) -> None:
+    storage = open_storage(args.store, args.db)
+    try:
+        with Spool(args.spool_dir) as spool:
+            result = spool.drain(storage, batch_size=args.batch_size)
+    except SpoolBusy as e:
+        raise SystemExit(f"[Spool] {e}")
+    finally:
+        storage.close()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
 
+
+def compact(args: argparse.Namespace) -> None:
+    storage = open_storage(args.store, args.db)
+    try:
+        result = run_compact(storage, drop_days=args.drop_days, strip_days=args.strip_days,
+                             vacuum=args.vacuum, time_budget=args.time_budget)
+    finally:
+        storage.close()
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+def serve(args: argparse.Namespace) -> None:
+    srv = make_server(args.db, args.host, args.port, args.poll_interval)
+    print(f"[Feed] serving {args.db} on http://{args.host}:{srv.server_address[1]} (/changes, /stream)")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+
+
+def collect(args: argparse.Namespace, api_key: str, storage: Storage, spool: Optional[Spool],
+            image_prober: Optional[ImageProber]) -> Dict[str, Dict[str, int]]:
+    scorer = Scorer.from_file(args.rank_config) if args.rank_config else Scorer()
     if args.domains_file:
         langs: List[str] = [s.strip() for s in args.languages.split(",") if s.strip()]
-        result = collect_categories_domains_mode(
+        return collect_categories_domains_mode(
             categories=args.categories,
             page_size=args.page_size,
             since_hours=args.since_hours,
@@ -62,11 +126,14 @@ def main() -> None:
             languages=langs,
             domains_file=args.domains_file,
             debug=args.debug,
-            save_fn=save_backend,
-            db_conn=db_conn,
+            storage=storage,
+            spool=spool,
+            image_prober=image_prober,
+            scorer=scorer,
+            top_k=args.top_k,
         )
     else:
-        result = collect_categories(
+        return collect_categories(
             categories=args.categories,
             country=args.country,
             page_size=args.page_size,
@@ -76,10 +143,61 @@ def main() -> None:
             api_key=api_key,
             to_json=args.out,
             debug=args.debug,
-            save_fn=save_backend,
-            db_conn=db_conn,
+            storage=storage,
+            spool=spool,
+            image_prober=image_prober,
+            scorer=scorer,
+            top_k=args.top_k,
         )
 
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+
+    if args.command == "drain":
+        drain(args)
+        return
+    if args.command == "compact":
+        compact(args)
+        return
+    if args.command == "serve":
+        serve(args)
+        return
+
+    invalid = [c for c in args.categories if c not in NEWSAPI_CATEGORIES]
+    if invalid:
+        raise ValueError(f"invalid category: {', '.join(invalid)}")
+
+    api_key = os.getenv("NEWSAPI_KEY")
+    if not api_key:
+        raise ValueError("NEWSAPI_KEY environment variable not set")
+
+    if args.outbox and args.store == "sqlite" and os.path.abspath(args.outbox) == os.path.abspath(args.db):
+        storage = open_storage(args.store, args.db, outbox=True)
+    else:
+        storage = open_storage(args.store, args.db)
+        if args.outbox:
+            storage = FeedStorage(storage, ChangeFeed.open(args.outbox))
+    spool = Spool(args.spool_dir) if args.spool_dir else None
+    prober = None
+    if args.enrich_images:
+        prober = ImageProber(max_workers=args.image_workers, per_host=args.image_per_host,
+                             cache=ImageCache(args.image_cache))
+    profiler = Profiler(args.profile, args.profile_out) if args.profile else None
+    try:
+        if profiler is not None:
+            profiler.start()
+        result = collect(args, api_key, storage, spool, prober)
+    finally:
+        if profiler is not None:
+            for kind, path in profiler.stop().items():
+                print(f"[Profile] {kind}: {path}", file=sys.stderr)
+        if prober is not None:
+            prober.close()
+        if spool is not None:
+            spool.close()
+        storage.close()
+
     print(json.dumps([{"category": k, **v} for k, v in result.items()], ensure_ascii=False, indent=2))
 
 
@@ -8,6 +8,15 @@ from dateutil import tz, parser as dtparse
 from tqdm import tqdm
 
 from .api import fetch_top_headlines_category, fetch_everything_by_domains
+from .domains import load_domain_map
+from .images import ImageProber
+from .normalize import normalize_batch
+from .profiling import stage
+from .ranking import Scorer, merge_topk, parse_published
+from .spool import Spool, SpoolBusy
+from .storage import CallbackStorage, Storage, chunked
+
+SAVE_BATCH = 100
 
 
 def filter_since(items: List[Dict], since_dt: Optional[dt.datetime], keep_no_pub: bool = True) -> List[Dict]:
@@ -29,6 +38,69 @@ def filter_since(items: List[Dict], since_dt: Optional[dt.datetime], keep_no_pub
     return out
 
 
+def _resolve_storage(storage: Optional[Storage], save_fn: Optional[Callable[[Any, Dict], bool]],
+                     db_conn: Any) -> Storage:
+    if storage is not None:
+        return storage
+    if save_fn is None:
+        raise ValueError("storage 또는 save_fn 필요")
+    return CallbackStorage(save_fn, db_conn)
+
+
+def _save_all(items: List[Dict], desc: str, storage: Storage, spool: Optional[Spool]) -> Dict[str, int]:
+    with tqdm(total=len(items), desc=desc) as bar:
+        if spool is None:
+            saved = 0
+            for chunk in chunked(items, SAVE_BATCH):
+                saved += sum(storage.save_many(chunk))
+                bar.update(len(chunk))
+            return {"saved": saved, "skipped": len(items) - saved}
+
+        # 스풀에 먼저 fsync 후 저장 → 저장 중 죽어도 `news-collector drain` 으로 재생 가능
+        spool.extend(items)
+        try:
+            r = spool.drain(storage, batch_size=SAVE_BATCH, on_batch=lambda b, _f: bar.update(len(b)))
+        except SpoolBusy:
+            # 별도 drain 프로세스가 소비 중 → 스풀에 기록된 기사는 그쪽이 저장
+            print(f"[Spool] {spool.path} busy, {len(items)} articles left for the running drain")
+            return {"saved": 0, "skipped": 0}
+    return {"saved": r["saved"], "skipped": r["skipped"]}
+
+
+def _enrich_new(items: List[Dict], storage: Storage, prober: Optional[ImageProber], debug: bool) -> None:
+    if prober is None or not items:
+        return
+    existing = storage.existing_ids(a["id"] for a in items)
+    new = [a for a in items if a["id"] not in existing]
+    n = prober.enrich(new)
+    if debug:
+        print(f"[Images] probed {n}/{len(new)} new (cache={len(prober.cache)})")
+
+
+def _update_topk(cat: str, saved: List[Dict], storage: Storage, top_k: Optional[int], debug: bool) -> None:
+    if not top_k or not hasattr(storage, "store_topk"):
+        return
+    # 발행 시각 없는 기사는 점수가 실행 시각에 따라 커지므로 영속 top-K 후보에서 제외
+    candidates = [(a["score"], a["id"]) for a in saved if parse_published(a.get("published"))]
+    merged = merge_topk(storage.load_topk(cat), candidates, top_k)
+    storage.store_topk(cat, merged)
+    if debug:
+        print(f"[TopK] {cat}: {len(merged)}/{top_k}")
+
+
+def _replay_spool(spool: Optional[Spool], storage: Storage, debug: bool) -> None:
+    if spool is None:
+        return
+    try:
+        r = spool.drain(storage, batch_size=SAVE_BATCH)
+    except SpoolBusy:
+        if debug:
+            print(f"[Spool] {spool.path} busy, skip replay")
+        return
+    if debug and r["count"]:
+        print(f"[Spool] replayed {r['count']} (saved={r['saved']}, skipped={r['skipped']})")
+
+
 def collect_categories(
         categories: List[str],
         country: str,
@@ -40,11 +112,19 @@ def collect_categories(
         to_json: Optional[str],
         debug: bool = False,
         *,
-        save_fn: Callable[[Any, Dict], bool],
-        db_conn: Any,
+        save_fn: Optional[Callable[[Any, Dict], bool]] = None,
+        db_conn: Any = None,
+        storage: Optional[Storage] = None,
+        spool: Optional[Spool] = None,
+        image_prober: Optional[ImageProber] = None,
+        scorer: Optional[Scorer] = None,
+        top_k: Optional[int] = None,
 ) -> Dict[str, Dict[str, int]]:
     if not api_key:
         raise RuntimeError("NEWSAPI_KEY 필요")
+    storage = _resolve_storage(storage, save_fn, db_conn)
+    scorer = scorer or Scorer()
+    _replay_spool(spool, storage, debug)
 
     since_dt = None
     if since_hours is not None:
@@ -55,26 +135,29 @@ def collect_categories(
     results: Dict[str, Dict[str, int]] = {}
     dump: List[Dict] = []
     for cat in categories:
-        fetched = fetch_top_headlines_category(api_key, cat, country, page_size, max_pages, debug)
+        with stage("fetch"):
+            fetched = fetch_top_headlines_category(api_key, cat, country, page_size, max_pages, debug)
+        with stage("normalize"):
+            fetched = normalize_batch(fetched)
         before = len(fetched)
-        filtered = filter_since(fetched, since_dt, True)
-        if debug:
-            print(f"[Filter] {cat}: {before} -> {len(filtered)}")
-        filtered.sort(key=lambda x: x.get("published") or "", reverse=True)
-        if limit_per_cat:
-            filtered = filtered[:limit_per_cat]
-        saved = skipped = 0
-        for a in tqdm(filtered, desc=f"Saving [{cat}]"):
-            if save_fn(db_conn, a):
-                saved += 1
-            else:
-                skipped += 1
-        results[cat] = {"saved": saved, "skipped": skipped, "count": len(filtered)}
+        with stage("filter"):
+            filtered = filter_since(fetched, since_dt, True)
+            if debug:
+                print(f"[Filter] {cat}: {before} -> {len(filtered)}")
+            filtered = scorer.rank(filtered)
+            if limit_per_cat:
+                filtered = filtered[:limit_per_cat]
+        with stage("enrich"):
+            _enrich_new(filtered, storage, image_prober, debug)
+        with stage("save"):
+            r = _save_all(filtered, f"Saving [{cat}]", storage, spool)
+            _update_topk(cat, filtered, storage, top_k, debug)
+        results[cat] = {**r, "count": len(filtered)}
         if to_json:
             dump.extend(filtered)
 
     if to_json:
-        with open(to_json, "w", encoding="utf-8") as f:
+        with stage("export"), open(to_json, "w", encoding="utf-8") as f:
             json.dump(dump, f, ensure_ascii=False, indent=2)
     return results
 
@@ -91,15 +174,21 @@ def collect_categories_domains_mode(
         domains_file: str,
         debug: bool = False,
         *,
-        save_fn: Callable[[Any, Dict], bool],
-        db_conn: Any,
+        save_fn: Optional[Callable[[Any, Dict], bool]] = None,
+        db_conn: Any = None,
+        storage: Optional[Storage] = None,
+        spool: Optional[Spool] = None,
+        image_prober: Optional[ImageProber] = None,
+        scorer: Optional[Scorer] = None,
+        top_k: Optional[int] = None,
 ) -> Dict[str, Dict[str, int]]:
     if not api_key:
         raise RuntimeError("NEWSAPI_KEY 필요")
+    storage = _resolve_storage(storage, save_fn, db_conn)
+    scorer = scorer or Scorer()
+    _replay_spool(spool, storage, debug)
 
-    with open(domains_file, "r", encoding="utf-8") as f:
-        raw_map = json.load(f)
-    dom_map = {k: ",".join(sorted(set(v))) for k, v in raw_map.items()}
+    dom_map = load_domain_map(domains_file)
 
     since_dt = None
     if since_hours is not None:
@@ -110,7 +199,7 @@ def collect_categories_domains_mode(
     results: Dict[str, Dict[str, int]] = {}
     dump: List[Dict] = []
     for cat in categories:
-        dom_csv = dom_map.get(cat)
+        dom_csv = dom_map.csv(cat)
         if not dom_csv:
             if debug:
                 print(f"[Domains] {cat}: none")
@@ -118,42 +207,44 @@ def collect_categories_domains_mode(
             continue
 
         merged: List[Dict] = []
-        for lang in languages:
-            merged.extend(
-                fetch_everything_by_domains(
-                    api_key,
-                    domains_csv=dom_csv,
-                    language=lang,
-                    page_size=page_size,
-                    max_pages=max_pages,
-                    debug=debug,
+        with stage("fetch"):
+            for lang in languages:
+                merged.extend(
+                    fetch_everything_by_domains(
+                        api_key,
+                        domains_csv=dom_csv,
+                        language=lang,
+                        page_size=page_size,
+                        max_pages=max_pages,
+                        debug=debug,
+                    )
                 )
-            )
 
+        with stage("normalize"):
+            merged = normalize_batch(merged)
         before = len(merged)
-        filtered = filter_since(merged, since_dt, True)
-        if debug:
-            print(f"[Domains] {cat}: {before} -> {len(filtered)} (langs={','.join(languages)})")
-
-        for it in filtered:
-            it["category"] = cat
+        with stage("filter"):
+            filtered = filter_since(merged, since_dt, True)
+            if debug:
+                print(f"[Domains] {cat}: {before} -> {len(filtered)} (langs={','.join(languages)})")
 
-        filtered.sort(key=lambda x: x.get("published") or "", reverse=True)
-        if limit_per_cat:
-            filtered = filtered[:limit_per_cat]
+            for it in filtered:
+                it["category"] = cat
 
-        saved = skipped = 0
-        for a in tqdm(filtered, desc=f"Saving [domains:{cat}]"):
-            if save_fn(db_conn, a):
-                saved += 1
-            else:
-                skipped += 1
+            filtered = scorer.rank(filtered)
+            if limit_per_cat:
+                filtered = filtered[:limit_per_cat]
 
-        results[cat] = {"saved": saved, "skipped": skipped, "count": len(filtered)}
+        with stage("enrich"):
+            _enrich_new(filtered, storage, image_prober, debug)
+        with stage("save"):
+            r = _save_all(filtered, f"Saving [domains:{cat}]", storage, spool)
+            _update_topk(cat, filtered, storage, top_k, debug)
+        results[cat] = {**r, "count": len(filtered)}
         if to_json:
             dump.extend(filtered)
 
     if to_json:
-        with open(to_json, "w", encoding="utf-8") as f:
+        with stage("export"), open(to_json, "w", encoding="utf-8") as f:
             json.dump(dump, f, ensure_ascii=False, indent=2)
     return results
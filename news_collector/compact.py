@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import datetime as dt
+import time
+from typing import Any, Dict, Optional
+
+from dateutil import tz
+
+VACUUM_MODES = ["incremental", "full", "none"]
+COMPACT_STORES = ["sqlite", "firestore"]  # memory 는 보존할 것이 없음
+
+
+class Budget:
+    """compaction 시간 예산 (초). None 이면 무제한."""
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.started = time.monotonic()
+        self.deadline = self.started + seconds if seconds else None
+
+    def exhausted(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+
+def cutoff(days: Optional[int], now: Optional[dt.datetime] = None) -> Optional[dt.datetime]:
+    if days is None:
+        return None
+    now = now or dt.datetime.now(tz=tz.UTC)
+    return (now - dt.timedelta(days=days)).replace(microsecond=0)
+
+
+def run_compact(storage: Any, *, drop_days: Optional[int], strip_days: Optional[int],
+                vacuum: str = "incremental", time_budget: Optional[float] = None,
+                now: Optional[dt.datetime] = None) -> Dict[str, Any]:
+    """
+    보존 정책 적용.
+    - drop_days 보다 오래된 기사 삭제
+    - strip_days 보다 오래된 기사의 raw_json 제거
+    - sqlite 는 이후 VACUUM / incremental_vacuum
+    반환: deleted / stripped / reclaimed_bytes / elapsed / docs_per_sec / complete(예산 안에 끝났는지)
+    """
+    compact = getattr(storage, "compact", None)
+    if compact is None:
+        raise ValueError(f"{type(storage).__name__} does not support compaction")
+    budget = Budget(time_budget)
+    r = compact(drop_before=cutoff(drop_days, now), strip_before=cutoff(strip_days, now),
+                vacuum=vacuum, budget=budget)
+    elapsed = budget.elapsed()
+    touched = r["deleted"] + r["stripped"]
+    return {**r, "elapsed": round(elapsed, 3), "docs_per_sec": round(touched / elapsed, 1) if elapsed else 0.0}
@@ -1,4 +1,5 @@
 DB_PATH = "news.db"
+NEWSAPI_BASE_URL = "https://newsapi.org/v2"
 NEWSAPI_CATEGORIES = [
     "business", "entertainment", "general", "health", "science", "sports", "technology"
 ]
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import datetime as dt
 import json
 import sqlite3
-from typing import Dict, Optional
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
+from .compact import Budget
 from .constants import DB_PATH
+from .feed import ChangeFeed
+from .storage import chunked
+
+SQLITE_MAX_VARS = 500  # IN (...) 바인딩 수 제한(999) 여유 있게
+VACUUM_STEP_PAGES = 256  # incremental_vacuum 한 번에 반환할 페이지 수 (사이사이 예산 확인)
 
 
 def connect_db(path: str = DB_PATH) -> sqlite3.Connection:
@@ -18,12 +26,26 @@ def connect_db(path: str = DB_PATH) -> sqlite3.Connection:
         published TEXT,
         summary TEXT,
         categories TEXT,
-        raw_json TEXT
+        raw_json TEXT,
+        image_json TEXT,
+        lang TEXT
     )""")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_pub ON articles(published)")
     cols = [r[1] for r in conn.execute("PRAGMA table_info(articles)").fetchall()]
     if "categories" not in cols:
         conn.execute("ALTER TABLE articles ADD COLUMN categories TEXT")
+    if "image_json" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN image_json TEXT")
+    if "lang" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN lang TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_lang ON articles(lang, published)")
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS topk(
+        category TEXT,
+        id TEXT,
+        score REAL,
+        PRIMARY KEY(category, id)
+    )""")
     return conn
 
 
@@ -34,13 +56,20 @@ def _merge_categories(old_csv: Optional[str], new_cat: Optional[str]) -> str:
     return ",".join(sorted(s)) if s else ""
 
 
+INSERT_SQL = """INSERT INTO articles(id,title,url,source,published,summary,categories,raw_json,image_json,lang)
+                VALUES(?,?,?,?,?,?,?,?,?,?)"""
+
+
+def _row(a: Dict) -> tuple:
+    return (a["id"], a.get("title"), a.get("url"), a.get("source"),
+            a.get("published"), a.get("summary"),
+            a.get("category", "") or "", json.dumps(a.get("raw"), ensure_ascii=False),
+            json.dumps(a["image"]) if a.get("image") else None, a.get("lang"))
+
+
 def save_article(conn: sqlite3.Connection, a: Dict) -> bool:
     try:
-        conn.execute("""INSERT INTO articles(id,title,url,source,published,summary,categories,raw_json)
-                        VALUES(?,?,?,?,?,?,?,?)""",
-                     (a["id"], a.get("title"), a.get("url"), a.get("source"),
-                      a.get("published"), a.get("summary"),
-                      a.get("category", "") or "", json.dumps(a.get("raw"), ensure_ascii=False)))
+        conn.execute(INSERT_SQL, _row(a))
         conn.commit()
         return True
     except sqlite3.IntegrityError:
@@ -50,3 +79,164 @@ def save_article(conn: sqlite3.Connection, a: Dict) -> bool:
         conn.execute("UPDATE articles SET categories=? WHERE id=?", (merged, a["id"]))
         conn.commit()
         return False
+
+
+class SQLiteStorage:
+    """
+    Storage 구현 (sqlite). save_many 는 배치 전체를 한 트랜잭션으로 처리.
+    outbox=True 면 같은 트랜잭션에서 변경 이벤트(insert/update)를 outbox 테이블에 기록 (기본 꺼짐, --outbox).
+    """
+
+    def __init__(self, path: str = DB_PATH, conn: Optional[sqlite3.Connection] = None, outbox: bool = False):
+        self.path = path
+        self.conn = conn
+        self.outbox = outbox
+        self.feed: Optional[ChangeFeed] = None
+
+    def open(self) -> None:
+        if self.conn is None:
+            self.conn = connect_db(self.path)
+        if self.outbox and self.feed is None:
+            self.feed = ChangeFeed(self.conn)
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        ids = list(dict.fromkeys(ids))
+        found: Set[str] = set()
+        for chunk in chunked(ids, SQLITE_MAX_VARS):
+            q = f"SELECT id FROM articles WHERE id IN ({','.join('?' * len(chunk))})"
+            found.update(r[0] for r in self.conn.execute(q, chunk))
+        return found
+
+    def _merge(self, ids: Sequence[str], category: str) -> List[str]:
+        """categories 가 실제로 바뀐 id 목록 반환."""
+        changed: List[str] = []
+        for chunk in chunked(list(dict.fromkeys(ids)), SQLITE_MAX_VARS):
+            q = f"SELECT id, categories FROM articles WHERE id IN ({','.join('?' * len(chunk))})"
+            updates = []
+            for i, old in self.conn.execute(q, chunk).fetchall():
+                merged = _merge_categories(old, category)
+                if merged != (old or ""):
+                    updates.append((merged, i))
+            self.conn.executemany("UPDATE articles SET categories=? WHERE id=?", updates)
+            changed.extend(i for _, i in updates)
+        return changed
+
+    def merge_categories(self, ids: Iterable[str], category: str) -> List[str]:
+        with self.conn:
+            changed = self._merge(list(ids), category)
+            if self.feed is not None:
+                self.feed.publish((i, "update", category) for i in changed)
+        return changed
+
+    def save_many(self, items: Sequence[Dict]) -> List[bool]:
+        return self.save_many_changes(items)[0]
+
+    def save_many_changes(self, items: Sequence[Dict]) -> Tuple[List[bool], List[Tuple[str, str]]]:
+        """save_many + categories 가 실제로 바뀐 기존 기사의 (id, category) 목록."""
+        flags: List[bool] = []
+        with self.conn:
+            seen = self.existing_ids(a["id"] for a in items)
+            rows = []
+            merges: Dict[str, List[str]] = defaultdict(list)
+            for a in items:
+                if a["id"] in seen:
+                    flags.append(False)
+                    merges[a.get("category", "") or ""].append(a["id"])
+                else:
+                    seen.add(a["id"])
+                    flags.append(True)
+                    rows.append(_row(a))
+            self.conn.executemany(INSERT_SQL, rows)
+            updates = [(i, cat) for cat, ids in merges.items() for i in self._merge(ids, cat)]
+            if self.feed is not None:
+                self.feed.publish([(r[0], "insert", r[6]) for r in rows] + [(i, "update", c) for i, c in updates])
+        return flags, updates
+
+    def load_topk(self, category: str) -> List[tuple]:
+        """카테고리별 상위 K (score, id), 점수 내림차순."""
+        return [(sc, i) for i, sc in self.conn.execute(
+            "SELECT id, score FROM topk WHERE category=? ORDER BY score DESC", (category,))]
+
+    def store_topk(self, category: str, entries: Sequence[tuple]) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM topk WHERE category=?", (category,))
+            self.conn.executemany("INSERT INTO topk(category, id, score) VALUES(?,?,?)",
+                                  [(category, i, sc) for sc, i in entries])
+
+    def _has_outbox(self) -> bool:
+        row = self.conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='outbox'").fetchone()
+        return row is not None
+
+    def _db_bytes(self) -> int:
+        return (self.conn.execute("PRAGMA page_count").fetchone()[0]
+                * self.conn.execute("PRAGMA page_size").fetchone()[0])
+
+    def _batched(self, sql: str, params: tuple, budget: Budget, batch: int) -> tuple:
+        total = 0
+        while not budget.exhausted():
+            with self.conn:
+                n = self.conn.execute(sql, params + (batch,)).rowcount
+            total += n
+            if n < batch:
+                return total, True
+        return total, False
+
+    def compact(self, *, drop_before: Optional[dt.datetime], strip_before: Optional[dt.datetime],
+                vacuum: str = "incremental", budget: Optional[Budget] = None, batch: int = 1000) -> Dict[str, Any]:
+        """
+        오래된 기사 삭제 / raw_json 제거 후 VACUUM.
+        batch 건씩 커밋하면서 budget 을 확인하고, 예산이 끝나면 complete=False 로 중단.
+        published 는 UTC ISO8601 문자열이라 문자열 비교로 범위 조건을 건다.
+        """
+        budget = budget or Budget()
+        before = self._db_bytes()
+        deleted = stripped = 0
+        complete = True
+        if drop_before is not None:
+            deleted, complete = self._batched(
+                "DELETE FROM articles WHERE rowid IN (SELECT rowid FROM articles WHERE published < ? LIMIT ?)",
+                (drop_before.isoformat(),), budget, batch)
+        if strip_before is not None and complete:
+            stripped, complete = self._batched(
+                "UPDATE articles SET raw_json=NULL WHERE rowid IN "
+                "(SELECT rowid FROM articles WHERE published < ? AND raw_json IS NOT NULL LIMIT ?)",
+                (strip_before.isoformat(),), budget, batch)
+        if deleted:
+            with self.conn:
+                self.conn.execute("DELETE FROM topk WHERE id NOT IN (SELECT id FROM articles)")
+        if drop_before is not None and self._has_outbox():
+            # outbox 를 켠 적이 있는 DB 면 compact 를 outbox=False 로 열어도 같은 보존 기간으로 정리
+            with self.conn:
+                (self.feed or ChangeFeed(self.conn)).prune(drop_before.isoformat())
+
+        hint = None
+        if vacuum != "none" and not budget.exhausted():
+            auto_vacuum = self.conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if vacuum == "full":
+                # 전체 재작성 (예산 무시, 파일 크기만큼 여유 공간 필요). 이때 incremental 로도 전환해 둔다
+                if auto_vacuum != 2:
+                    self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                self.conn.execute("VACUUM")
+            elif auto_vacuum == 2:
+                complete = self._incremental_vacuum(budget) and complete
+            else:
+                hint = "auto_vacuum is off; run `compact --vacuum full` once to enable incremental vacuum"
+        out = {"deleted": deleted, "stripped": stripped,
+               "reclaimed_bytes": max(0, before - self._db_bytes()), "complete": complete}
+        if hint:
+            out["hint"] = hint
+        return out
+
+    def _incremental_vacuum(self, budget: Budget, step: int = VACUUM_STEP_PAGES) -> bool:
+        """freelist 를 step 페이지씩 반환. 예산이 끝나면 중단하고 False."""
+        while self.conn.execute("PRAGMA freelist_count").fetchone()[0]:
+            if budget.exhausted():
+                return False
+            # 결과 행을 끝까지 읽어야 pragma 가 끝까지 실행됨
+            self.conn.execute(f"PRAGMA incremental_vacuum({int(step)})").fetchall()
+        return True
@@ -1,11 +1,17 @@
 # news_collector/db_firestore.py
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional
+import datetime as dt
+import json
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Set, Tuple
 
 import firebase_admin
 from dateutil import parser as dtparse
 from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+from .compact import Budget
+from .utils import extract_image_url
 
 _app = None
 _db: Optional[firestore.Client] = None
@@ -44,11 +50,7 @@ def _parse_timestamp(iso_str: Optional[str]):
 
 def _extract_image_url(raw: Any) -> Optional[str]:
     """NewsAPI 원본에서 대표 이미지 URL 추출."""
-    if isinstance(raw, dict):
-        url = raw.get("urlToImage") or raw.get("imageUrl") or raw.get("image_url")
-        if isinstance(url, str) and url.strip():
-            return url.strip()
-    return None
+    return extract_image_url(raw)
 
 
 def _to_doc(a: Dict) -> Dict[str, Any]:
@@ -58,6 +60,8 @@ def _to_doc(a: Dict) -> Dict[str, Any]:
     - published_ts (Timestamp) 추가 저장 (정렬/범위쿼리용)
     - categories: 배열로 저장
     - image_url: raw_json에서 추출해 명시 필드로 저장
+    - lang: 판별 언어 (ko/en ...), 언어별 피드 쿼리용
+    - image: 이미지 조회 결과(content_type/bytes/width/height/alive), 있을 때만
     """
     cat = (a.get("category") or "").strip()
     cats: List[str] = [cat] if cat else []
@@ -74,8 +78,10 @@ def _to_doc(a: Dict) -> Dict[str, Any]:
         "published": published_iso,
         "published_ts": ts,  # ✅ Timestamp
         "summary": a.get("summary"),
+        "lang": a.get("lang"),
         "categories": cats,  # 배열
         "image_url": img,
+        "image": a.get("image"),
         "raw_json": a.get("raw"),
     }
     # None 값은 필드에서 제거
@@ -108,3 +114,188 @@ def save_article(db: firestore.Client, a: Dict) -> bool:
 
     ref.set(update, merge=True)
     return False
+
+
+BATCH_LIMIT = 450  # Firestore write batch ≤ 500, 여유 있게
+STATE_COLLECTION = "compact_state"  # compact_state/{collection}: raw_json 제거 진행 위치(strip_watermark)
+
+
+class FirestoreStorage:
+    """
+    Storage 구현 (Firestore).
+    - existing_ids: get_all() 로 한 번에 조회
+    - save_many: 조회 1회 + WriteBatch 커밋(≤ BATCH_LIMIT 건 단위)
+    """
+
+    def __init__(self, db: Optional[firestore.Client] = None, collection: str = "articles"):
+        self.db = db
+        self.collection = collection
+
+    def open(self) -> None:
+        if self.db is None:
+            self.db = connect_firestore()
+
+    def close(self) -> None:
+        pass
+
+    def _snapshots(self, ids: Iterable[str]) -> Dict[str, Any]:
+        col = self.db.collection(self.collection)
+        refs = [col.document(i) for i in dict.fromkeys(ids)]
+        out: Dict[str, Any] = {}
+        for i in range(0, len(refs), BATCH_LIMIT):
+            for snap in self.db.get_all(refs[i:i + BATCH_LIMIT]):
+                if snap.exists:
+                    out[snap.id] = snap
+        return out
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        return set(self._snapshots(ids))
+
+    def _commit(self, writes: List[Tuple[Any, Dict[str, Any], bool]]) -> None:
+        for i in range(0, len(writes), BATCH_LIMIT):
+            batch = self.db.batch()
+            for ref, data, merge in writes[i:i + BATCH_LIMIT]:
+                batch.set(ref, data, merge=merge)
+            batch.commit()
+
+    def merge_categories(self, ids: Iterable[str], category: str) -> List[str]:
+        if not category:
+            return []
+        writes = []
+        for doc_id, snap in self._snapshots(ids).items():
+            cats = set((snap.to_dict() or {}).get("categories") or [])
+            if category not in cats:
+                writes.append((snap.reference, {"categories": sorted(cats | {category})}, True))
+        self._commit(writes)
+        return [ref.id for ref, _, _ in writes]
+
+    def save_many(self, items: Sequence[Dict]) -> List[bool]:
+        return self.save_many_changes(items)[0]
+
+    def save_many_changes(self, items: Sequence[Dict]) -> Tuple[List[bool], List[Tuple[str, str]]]:
+        """save_many + categories 가 실제로 바뀐 기존 문서의 (id, category) 목록 (이미 읽은 스냅샷과 비교)."""
+        col = self.db.collection(self.collection)
+        snaps = self._snapshots(a["id"] for a in items)
+        known: Dict[str, Set[str]] = {i: set((s.to_dict() or {}).get("categories") or []) for i, s in snaps.items()}
+        # 같은 배치 안의 동일 id 는 마지막 쓰기 하나로 합침
+        pending: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+        flags: List[bool] = []
+        updates: List[Tuple[str, str]] = []
+        for a in items:
+            data = _to_doc(a)
+            cats = set(data.get("categories") or [])
+            if a["id"] in known:
+                updates.extend((a["id"], c) for c in sorted(cats - known[a["id"]]))
+                known[a["id"]] |= cats
+                data["categories"] = sorted(known[a["id"]])
+                prev = pending.get(a["id"])
+                pending[a["id"]] = (data, prev[1] if prev else True)
+                flags.append(False)
+            else:
+                known[a["id"]] = cats
+                pending[a["id"]] = (data, False)
+                flags.append(True)
+        self._commit([(col.document(i), data, merge) for i, (data, merge) in pending.items()])
+        return flags, updates
+
+    def load_topk(self, category: str) -> List[Tuple[float, str]]:
+        """topk/{category} 문서 1개 읽기로 상위 K 반환."""
+        snap = self.db.collection("topk").document(category).get()
+        entries = ((snap.to_dict() or {}).get("entries") or []) if snap.exists else []
+        return [(e["score"], e["id"]) for e in entries]
+
+    def store_topk(self, category: str, entries: Sequence[Tuple[float, str]]) -> None:
+        self.db.collection("topk").document(category).set({
+            "entries": [{"id": i, "score": sc} for sc, i in entries],
+            "updated": firestore.SERVER_TIMESTAMP,
+        })
+
+    def _scan_older(self, before: dt.datetime, budget: Budget, page_size: int,
+                    after: Optional[dt.datetime] = None, restart: bool = False):
+        """published_ts 범위를 published_ts 순서로 페이지 단위 스캔. restart=True 면 매 페이지 처음부터(삭제용)."""
+        col = self.db.collection(self.collection)
+        last = None
+        while not budget.exhausted():
+            q = col.where(filter=FieldFilter("published_ts", "<", before))
+            if after is not None:
+                q = q.where(filter=FieldFilter("published_ts", ">=", after))
+            q = q.order_by("published_ts")
+            if last is not None and not restart:
+                q = q.start_after(last)
+            docs = list(q.limit(page_size).stream())
+            if not docs:
+                return
+            yield docs
+            last = docs[-1]
+            if len(docs) < page_size:
+                return
+
+    def _strip_watermark(self) -> Optional[dt.datetime]:
+        snap = self.db.collection(STATE_COLLECTION).document(self.collection).get()
+        return (snap.to_dict() or {}).get("strip_watermark") if snap.exists else None
+
+    def _prune_topk(self, gone: Set[str]) -> None:
+        """삭제된 기사를 topk/{category} 문서들의 entries 에서 제거."""
+        if not gone:
+            return
+        writes = []
+        for snap in self.db.collection("topk").stream():
+            entries = (snap.to_dict() or {}).get("entries") or []
+            kept = [e for e in entries if e["id"] not in gone]
+            if len(kept) != len(entries):
+                writes.append((snap.reference, {"entries": kept, "updated": firestore.SERVER_TIMESTAMP}, True))
+        self._commit(writes)
+
+    def compact(self, *, drop_before: Optional[dt.datetime], strip_before: Optional[dt.datetime],
+                vacuum: str = "incremental", budget: Optional[Budget] = None,
+                page_size: int = BATCH_LIMIT) -> Dict[str, Any]:
+        """
+        오래된 문서 batch delete (topk 문서에서도 제거) / raw_json 필드 batch 제거.
+        reclaimed_bytes 는 JSON 직렬화 크기 기준 추정치. vacuum 은 sqlite 전용이라 무시.
+        raw_json 제거는 compact_state 의 watermark(마지막으로 스캔한 published_ts)부터 이어서 하므로
+        예산이 짧아도 실행마다 앞으로 나아간다.
+        """
+        budget = budget or Budget()
+        deleted = stripped = reclaimed = 0
+        gone: Set[str] = set()
+
+        if drop_before is not None:
+            for docs in self._scan_older(drop_before, budget, page_size, restart=True):
+                batch = self.db.batch()
+                for d in docs:
+                    reclaimed += _approx_size(d.to_dict())
+                    batch.delete(d.reference)
+                    gone.add(d.id)
+                batch.commit()
+                deleted += len(docs)
+            self._prune_topk(gone)
+
+        if strip_before is not None and not budget.exhausted():
+            # 이미 제거한 구간은 다시 읽지 않도록 이전 실행이 멈춘 위치(watermark)부터 스캔
+            mark = self._strip_watermark()
+            start = max((t for t in (drop_before, mark) if t is not None), default=None)
+            last_ts = None
+            for docs in self._scan_older(strip_before, budget, page_size, after=start):
+                last_ts = docs[-1].get("published_ts")
+                batch = self.db.batch()
+                n = 0
+                for d in docs:
+                    raw = (d.to_dict() or {}).get("raw_json")
+                    if raw is None:
+                        continue
+                    reclaimed += _approx_size(raw)
+                    batch.update(d.reference, {"raw_json": firestore.DELETE_FIELD})
+                    n += 1
+                if n:
+                    batch.commit()
+                stripped += n
+            if last_ts is not None:
+                self.db.collection(STATE_COLLECTION).document(self.collection).set(
+                    {"strip_watermark": last_ts, "updated": firestore.SERVER_TIMESTAMP}, merge=True)
+
+        return {"deleted": deleted, "stripped": stripped, "reclaimed_bytes": reclaimed,
+                "complete": not budget.exhausted()}
+
+
+def _approx_size(v: Any) -> int:
+    return len(json.dumps(v, ensure_ascii=False, default=str).encode("utf-8"))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+
+class MemoryStorage:
+    """Storage 구현 (프로세스 메모리). 테스트/드라이런/로드테스트용."""
+
+    def __init__(self):
+        self.articles: Dict[str, Dict] = {}
+        self.topk: Dict[str, List[Tuple[float, str]]] = {}
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        return {i for i in ids if i in self.articles}
+
+    def merge_categories(self, ids: Iterable[str], category: str) -> List[str]:
+        if not category:
+            return []
+        changed = []
+        for i in dict.fromkeys(ids):
+            doc = self.articles.get(i)
+            if doc is not None and category not in doc["categories"]:
+                doc["categories"] = sorted(set(doc["categories"]) | {category})
+                changed.append(i)
+        return changed
+
+    def save_many(self, items: Sequence[Dict]) -> List[bool]:
+        return self.save_many_changes(items)[0]
+
+    def save_many_changes(self, items: Sequence[Dict]) -> Tuple[List[bool], List[Tuple[str, str]]]:
+        flags: List[bool] = []
+        updates: List[Tuple[str, str]] = []
+        for a in items:
+            cat = (a.get("category") or "").strip()
+            if a["id"] in self.articles:
+                updates.extend((i, cat) for i in self.merge_categories([a["id"]], cat))
+                flags.append(False)
+                continue
+            doc = {k: v for k, v in a.items() if k != "category"}
+            doc["categories"] = [cat] if cat else []
+            self.articles[a["id"]] = doc
+            flags.append(True)
+        return flags, updates
+
+    def load_topk(self, category: str) -> List[Tuple[float, str]]:
+        return list(self.topk.get(category, []))
+
+    def store_topk(self, category: str, entries: Sequence[Tuple[float, str]]) -> None:
+        self.topk[category] = sorted(entries, reverse=True)
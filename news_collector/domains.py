@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .constants import NEWSAPI_CATEGORIES
+
+
+def _norm_host(host: str) -> str:
+    host = host.strip().lower().split(":", 1)[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+class DomainMap:
+    """
+    category -> domains 설정 (kr_domains.json).
+    - 로드 시 검증 (알 수 없는 카테고리, 빈 값, 스킴 포함 등은 ValueError)
+    - 카테고리별 /v2/everything 요청 파라미터 미리 계산
+    - domain(host[/path]) -> categories 역색인: URL 로 카테고리 찾기
+    """
+
+    def __init__(self, mapping: Mapping[str, Sequence[str]]):
+        self.domains: Dict[str, Tuple[str, ...]] = {}
+        self._params: Dict[str, Dict[str, str]] = {}
+        self._index: Dict[str, Tuple[str, ...]] = {}
+        for cat, doms in mapping.items():
+            uniq = tuple(sorted({d.strip().lower() for d in doms}))
+            self.domains[cat] = uniq
+            self._params[cat] = {"domains": ",".join(uniq)}
+            for d in uniq:
+                host, _, path = d.partition("/")
+                key = _norm_host(host) + ("/" + path.strip("/") if path else "")
+                if cat not in self._index.get(key, ()):
+                    self._index[key] = self._index.get(key, ()) + (cat,)
+
+    @staticmethod
+    def validate(raw: object) -> List[str]:
+        errors: List[str] = []
+        if not isinstance(raw, dict):
+            return ["top-level must be an object of category -> [domains]"]
+        for cat, doms in raw.items():
+            if cat not in NEWSAPI_CATEGORIES:
+                errors.append(f"unknown category: {cat}")
+            if not isinstance(doms, list) or not doms:
+                errors.append(f"{cat}: domains must be a non-empty list")
+                continue
+            for d in doms:
+                if not isinstance(d, str) or not d.strip():
+                    errors.append(f"{cat}: empty or non-string domain {d!r}")
+                elif "://" in d or any(ch.isspace() for ch in d.strip()) or "," in d:
+                    errors.append(f"{cat}: invalid domain {d!r} (host[/path] only)")
+        return errors
+
+    @classmethod
+    def from_file(cls, path: str) -> "DomainMap":
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        errors = cls.validate(raw)
+        if errors:
+            raise ValueError(f"invalid domains file {path}: " + "; ".join(errors))
+        return cls(raw)
+
+    def csv(self, category: str) -> Optional[str]:
+        p = self._params.get(category)
+        return p["domains"] if p else None
+
+    def params(self, category: str) -> Dict[str, str]:
+        return dict(self._params.get(category) or {})
+
+    def categorize(self, url: Optional[str]) -> Tuple[str, ...]:
+        """URL 의 host(+첫 path 세그먼트)로 카테고리 조회. 가장 구체적인 도메인부터 매칭."""
+        if not url:
+            return ()
+        parts = urlsplit(url if "://" in url else "//" + url)
+        host = _norm_host(parts.netloc)
+        seg = parts.path.strip("/").split("/", 1)[0]
+        if seg:
+            cats = self._index.get(f"{host}/{seg}")
+            if cats:
+                return cats
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            cats = self._index.get(".".join(labels[i:]))
+            if cats:
+                return cats
+        return ()
+
+    def __contains__(self, category: str) -> bool:
+        return category in self.domains
+
+
+_cache: Dict[str, Tuple[Tuple[int, int], DomainMap]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_domain_map(path: str) -> DomainMap:
+    """파일 mtime/size 기준으로 메모이즈. 파일이 바뀌면 다시 읽음 (hot reload)."""
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit and hit[0] == stamp:
+            return hit[1]
+    dmap = DomainMap.from_file(key)
+    with _cache_lock:
+        _cache[key] = (stamp, dmap)
+    return dmap
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import sqlite3
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from dateutil import tz
+
+from .constants import DB_PATH
+
+
+def ensure_outbox(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS outbox(
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        article_id TEXT,
+        op TEXT,
+        category TEXT,
+        ts TEXT
+    )""")
+
+
+class ChangeFeed:
+    """
+    저장된 기사의 변경 스트림 (sqlite outbox 테이블).
+    - seq: 단조 증가 (AUTOINCREMENT 라 삭제 후에도 재사용 안 됨)
+    - op: insert | update(categories 병합)
+    publish() 는 커밋하지 않음 → 호출자의 저장 트랜잭션과 함께 커밋되어야 원자적.
+    소비자는 마지막으로 받은 seq 를 cursor 로 들고 read(after=cursor) 로 이어받는다.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        ensure_outbox(conn)
+
+    @classmethod
+    def open(cls, path: str = DB_PATH) -> "ChangeFeed":
+        conn = sqlite3.connect(path)
+        feed = cls(conn)
+        conn.commit()
+        return feed
+
+    def publish(self, events: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """events: (article_id, op, category)"""
+        ts = dt.datetime.now(tz=tz.UTC).isoformat()
+        self.conn.executemany("INSERT INTO outbox(article_id, op, category, ts) VALUES(?,?,?,?)",
+                              [(i, op, cat or None, ts) for i, op, cat in events])
+
+    def read(self, after: int = 0, limit: int = 500) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT seq, article_id, op, category, ts FROM outbox WHERE seq > ? ORDER BY seq LIMIT ?",
+            (after, limit)).fetchall()
+        return [{"seq": s, "id": i, "op": op, "category": c, "ts": ts} for s, i, op, c, ts in rows]
+
+    def last_seq(self) -> int:
+        return self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM outbox").fetchone()[0]
+
+    def prune(self, before_ts: str) -> int:
+        """ts 가 before_ts 보다 오래된 이벤트 삭제 (compact 에서 사용)."""
+        return self.conn.execute("DELETE FROM outbox WHERE ts < ?", (before_ts,)).rowcount
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class FeedStorage:
+    """
+    다른 Storage 를 감싸 save_many 결과를 로컬 sqlite outbox 에 기록 (Firestore 등 sqlite 가 아닌 백엔드용).
+    inner 는 save_many_changes 를 제공해야 하며, categories 가 실제로 바뀐 경우만 update 이벤트를 남긴다 (sqlite 와 동일).
+    저장 후 기록하므로 그 사이에 죽으면 이벤트가 빠질 수 있음 (at-most-once).
+    """
+
+    def __init__(self, inner, feed: ChangeFeed):
+        self.inner = inner
+        self.feed = feed
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def open(self) -> None:
+        self.inner.open()
+
+    def close(self) -> None:
+        self.inner.close()
+        self.feed.close()
+
+    def existing_ids(self, ids):
+        return self.inner.existing_ids(ids)
+
+    def merge_categories(self, ids, category: str) -> List[str]:
+        changed = self.inner.merge_categories(ids, category)
+        with self.feed.conn:
+            self.feed.publish((i, "update", category) for i in changed)
+        return changed
+
+    def save_many(self, items: Sequence[Dict]) -> List[bool]:
+        flags, updates = self.inner.save_many_changes(items)
+        inserts = [(a["id"], "insert", a.get("category")) for a, f in zip(items, flags) if f]
+        with self.feed.conn:
+            self.feed.publish(inserts + [(i, "update", c) for i, c in updates])
+        return flags
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    """
+    GET /changes?after=N&limit=M  -> JSON {"events": [...], "cursor": 마지막 seq}
+    GET /stream?after=N           -> text/event-stream (Last-Event-ID 헤더로도 이어받기 가능)
+    """
+
+    db_path = DB_PATH
+    poll_interval = 1.0
+    heartbeat = 15.0
+
+    def log_message(self, *a):
+        pass
+
+    def _feed(self) -> ChangeFeed:
+        # 요청 스레드마다 별도 커넥션 (sqlite3 커넥션은 스레드 간 공유 불가)
+        return ChangeFeed.open(self.db_path)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        q = parse_qs(parts.query)
+        try:
+            after = int((q.get("after") or [self.headers.get("Last-Event-ID") or 0])[0])
+            limit = int((q.get("limit") or [500])[0])
+        except ValueError:
+            self.send_error(400, "after/limit must be integers")
+            return
+        if parts.path == "/changes":
+            self._changes(after, limit)
+        elif parts.path == "/stream":
+            self._stream(after, limit)
+        else:
+            self.send_error(404)
+
+    def _changes(self, after: int, limit: int) -> None:
+        feed = self._feed()
+        try:
+            events = feed.read(after, limit)
+        finally:
+            feed.close()
+        body = json.dumps({"events": events, "cursor": events[-1]["seq"] if events else after},
+                          ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, after: int, limit: int) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        feed = self._feed()
+        last_write = time.monotonic()
+        try:
+            while True:
+                events = feed.read(after, limit)
+                for e in events:
+                    self.wfile.write(f"id: {e['seq']}\nevent: {e['op']}\ndata: {json.dumps(e)}\n\n".encode("utf-8"))
+                    after = e["seq"]
+                if events:
+                    self.wfile.flush()
+                    last_write = time.monotonic()
+                    continue
+                if time.monotonic() - last_write >= self.heartbeat:
+                    self.wfile.write(b": ping\n\n")
+                    self.wfile.flush()
+                    last_write = time.monotonic()
+                time.sleep(self.poll_interval)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            feed.close()
+
+
+def make_server(db_path: str = DB_PATH, host: str = "127.0.0.1", port: int = 8765,
+                poll_interval: float = 1.0) -> ThreadingHTTPServer:
+    handler = type("FeedHandler", (_FeedHandler,), {"db_path": db_path, "poll_interval": poll_interval})
+    srv = ThreadingHTTPServer((host, port), handler)
+    srv.daemon_threads = True
+    return srv
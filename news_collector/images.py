@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import struct
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from .db import SQLITE_MAX_VARS
+from .storage import chunked
+from .utils import extract_image_url
+
+RANGE_BYTES = 64 * 1024  # 대부분 포맷의 크기 정보는 앞부분 수 KB 안에 있음
+
+
+def image_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """PNG/GIF/JPEG/WebP 헤더 바이트에서 (width, height) 추출. 모르면 None."""
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+        return struct.unpack(">II", data[16:24])
+    if data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+        return struct.unpack("<HH", data[6:10])
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP" and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b"VP8 ":
+            w, h = struct.unpack("<HH", data[26:30])
+            return w & 0x3FFF, h & 0x3FFF
+        if chunk == b"VP8L":
+            b = data[21:25]
+            w = 1 + (((b[1] & 0x3F) << 8) | b[0])
+            h = 1 + (((b[3] & 0x0F) << 10) | (b[2] << 2) | ((b[1] & 0xC0) >> 6))
+            return w, h
+        if chunk == b"VP8X":
+            w = 1 + int.from_bytes(data[24:27], "little")
+            h = 1 + int.from_bytes(data[27:30], "little")
+            return w, h
+    if data[:2] == b"\xff\xd8":
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+                i += 1 if marker == 0xFF else 2
+                continue
+            seg_len = struct.unpack(">H", data[i + 2:i + 4])[0]
+            # SOF0..SOF15 (DHT/JPG/DAC 제외)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                h, w = struct.unpack(">HH", data[i + 5:i + 9])
+                return w, h
+            i += 2 + seg_len
+    return None
+
+
+class ImageCache:
+    """
+    URL -> 이미지 메타데이터 캐시.
+    path 가 있으면 sqlite 파일에 영속화해서 다음 실행에서도 같은 URL 을 다시 조회하지 않음.
+    _mem 은 이번 실행에서 본 URL 만 담는 층이고, 영속 테이블은 배치 URL 만 IN (...) 으로 조회한다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._mem: Dict[str, Dict] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._conn = sqlite3.connect(path)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS image_meta(url TEXT PRIMARY KEY, meta_json TEXT)")
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """캐시에 있는 URL 만 {url: meta}. 메모리에 없는 것은 sqlite 에서 SQLITE_MAX_VARS 개씩 조회."""
+        urls = list(dict.fromkeys(urls))
+        out = {u: self._mem[u] for u in urls if u in self._mem}
+        missing = [u for u in urls if u not in out]
+        if self._conn is not None:
+            for chunk in chunked(missing, SQLITE_MAX_VARS):
+                q = f"SELECT url, meta_json FROM image_meta WHERE url IN ({','.join('?' * len(chunk))})"
+                for url, meta in self._conn.execute(q, chunk):
+                    out[url] = self._mem[url] = json.loads(meta)
+        return out
+
+    def get(self, url: str) -> Optional[Dict]:
+        return self.get_many([url]).get(url)
+
+    def put_many(self, metas: List[Dict]) -> None:
+        for m in metas:
+            self._mem[m["url"]] = m
+        if self._conn is not None and metas:
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO image_meta(url, meta_json) VALUES(?,?)",
+                                       [(m["url"], json.dumps(m)) for m in metas])
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def __len__(self) -> int:
+        """이번 실행에서 메모리에 올라온 항목 수."""
+        return len(self._mem)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class ImageProber:
+    """
+    새 기사들의 대표 이미지를 동시에 조회해 메타데이터를 기사에 붙임 (a["image"]).
+    - 요청: Range GET (앞 RANGE_BYTES 만) → content type / 전체 크기 / 가로세로 / 생존 여부
+    - 동시성: 전체 max_workers, 호스트별 per_host 로 제한
+    - 캐시: 같은 URL 은 한 번만 조회
+    """
+
+    def __init__(self, *, max_workers: int = 16, per_host: int = 4, timeout: float = 5.0,
+                 range_bytes: int = RANGE_BYTES, cache: Optional[ImageCache] = None):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.range_bytes = range_bytes
+        self.cache = cache if cache is not None else ImageCache()
+        self._host_sems: Dict[str, threading.Semaphore] = defaultdict(lambda: threading.Semaphore(self.per_host))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _session(self) -> requests.Session:
+        sess = getattr(self._local, "sess", None)
+        if sess is None:
+            sess = self._local.sess = requests.Session()
+        return sess
+
+    def _host_sem(self, url: str) -> threading.Semaphore:
+        with self._lock:
+            return self._host_sems[urlsplit(url).netloc.lower()]
+
+    def probe(self, url: str) -> Dict:
+        meta: Dict = {"url": url, "alive": False}
+        with self._host_sem(url):
+            try:
+                r = self._session().get(url, headers={"Range": f"bytes=0-{self.range_bytes - 1}"},
+                                        timeout=self.timeout, stream=True)
+            except requests.RequestException as e:
+                meta["error"] = type(e).__name__
+                return meta
+            try:
+                meta["status"] = r.status_code
+                if r.status_code not in (200, 206):
+                    return meta
+                ctype = (r.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+                meta["content_type"] = ctype or None
+                crange = r.headers.get("Content-Range") or ""
+                total = crange.rsplit("/", 1)[-1] if r.status_code == 206 else r.headers.get("Content-Length")
+                if total and total.isdigit():
+                    meta["bytes"] = int(total)
+                # 서버가 Range 를 무시(200)해도 앞부분만 읽고 끊음
+                head = b""
+                for chunk in r.iter_content(chunk_size=8192):
+                    head += chunk
+                    if len(head) >= self.range_bytes:
+                        break
+                size = image_size(head)
+                if size:
+                    meta["width"], meta["height"] = size
+                meta["alive"] = bool(head) and (not ctype or ctype.startswith("image/") or size is not None)
+            except requests.RequestException as e:
+                meta["error"] = type(e).__name__
+            finally:
+                r.close()
+        return meta
+
+    def probe_many(self, urls: List[str]) -> Dict[str, Dict]:
+        known = self.cache.get_many(urls)
+        todo = [u for u in dict.fromkeys(urls) if u not in known]
+        if todo:
+            if self._executor is None:
+                # 워커 스레드(=스레드별 Session)를 실행 간 재사용해서 keep-alive 연결 유지
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image")
+            fresh = {m["url"]: m for m in self._executor.map(self.probe, todo)}
+            # 네트워크 오류/5xx 는 일시적일 수 있으니 캐시하지 않음
+            self.cache.put_many([m for m in fresh.values() if "error" not in m and m.get("status", 0) < 500])
+        else:
+            fresh = {}
+        return {u: fresh.get(u) or known.get(u) for u in dict.fromkeys(urls)}
+
+    def enrich(self, items: List[Dict]) -> int:
+        """items 의 대표 이미지를 조회해 a["image"] 에 기록. 반환: 이미지가 있는 기사 수."""
+        urls = {a["id"]: extract_image_url(a.get("raw")) for a in items}
+        metas = self.probe_many([u for u in urls.values() if u])
+        n = 0
+        for a in items:
+            u = urls[a["id"]]
+            if u:
+                a["image"] = {k: v for k, v in metas[u].items() if k != "url"}
+                n += 1
+        return n
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.cache.close()
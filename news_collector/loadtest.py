@@ -0,0 +1,598 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import datetime as dt
+import io
+import json
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from dateutil import tz
+
+from . import api, cli
+from .constants import NEWSAPI_CATEGORIES
+
+ERROR_MESSAGES = {
+    426: ("parameterInvalid", "You are trying to request results too far in the past."),
+    429: ("rateLimited", "You have made too many requests recently."),
+    500: ("unexpectedError", "Internal server error."),
+    502: ("unexpectedError", "Bad gateway."),
+    503: ("unexpectedError", "Service unavailable."),
+}
+
+_KO = ["정부", "삼성전자", "반도체", "수출", "증가", "발표", "서울", "경제", "&quot;속보&quot;"]
+_EN = ["Government", "Samsung", "chip", "exports", "rise", "announced", "Seoul", "economy", "&amp;"]
+
+
+def percentile(values: Sequence[float], p: float) -> Optional[float]:
+    if not values:
+        return None
+    s = sorted(values)
+    k = min(len(s) - 1, max(0, int(round(p / 100.0 * (len(s) - 1)))))
+    return s[k]
+
+
+# ---------------------------------------------------------------------------
+# Fake NewsAPI
+# ---------------------------------------------------------------------------
+
+class FakeNewsAPI:
+    """
+    /v2/top-headlines, /v2/everything 를 흉내내는 로컬 서버.
+    - 질의(엔드포인트+카테고리/도메인+언어/국가)마다 articles_per_query 개의 결정적 기사
+    - latency_ms ± jitter_ms 지연, error_rate 확률로 error_codes 중 하나 반환
+    - max_consecutive_errors: 같은 질의에 연속으로 주입할 에러 수 상한 (None=제한 없음)
+    - 요청별 (경로, 상태코드, 처리시간) 과 TCP 연결 수를 기록
+    """
+
+    def __init__(self, *, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 error_codes: Sequence[int] = (429, 500, 503), articles_per_query: int = 200,
+                 max_page_size: int = 100, max_consecutive_errors: Optional[int] = None,
+                 shared_ratio: float = 0.1, seed: int = 0, host: str = "127.0.0.1", port: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_codes = list(error_codes)
+        self.articles_per_query = articles_per_query
+        self.max_page_size = max_page_size
+        self.max_consecutive_errors = max_consecutive_errors
+        self.shared_ratio = shared_ratio
+        self.now = dt.datetime.now(tz=tz.UTC).replace(microsecond=0)
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self._streak: Dict[Tuple, int] = defaultdict(int)
+        self.requests: List[Tuple[str, int, float]] = []
+        self.recovered: Counter = Counter()
+        self.connections = 0
+        self.articles_served = 0
+
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive → 연결 재사용 측정 가능
+
+            def setup(self):
+                super().setup()
+                with owner._lock:
+                    owner.connections += 1
+
+            def log_message(self, *a):
+                pass
+
+            def do_GET(self):
+                owner._handle(self)
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self) -> "FakeNewsAPI":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-newsapi", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "FakeNewsAPI":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ---------- request handling ----------
+
+    def _sleep(self) -> None:
+        if self.latency_ms or self.jitter_ms:
+            with self._lock:
+                ms = self._rnd.gauss(self.latency_ms, self.jitter_ms) if self.jitter_ms else self.latency_ms
+            time.sleep(max(0.0, ms) / 1000.0)
+
+    def _pick_error(self, key: Tuple) -> Optional[int]:
+        with self._lock:
+            inject = self.error_codes and self._rnd.random() < self.error_rate
+            if inject and self.max_consecutive_errors is not None and self._streak[key] >= self.max_consecutive_errors:
+                inject = False
+            if inject:
+                self._streak[key] += 1
+                return self._rnd.choice(self.error_codes)
+            if self._streak[key]:
+                self.recovered[key[0]] += 1
+            self._streak[key] = 0
+            return None
+
+    def _send(self, h: BaseHTTPRequestHandler, code: int, payload: Dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        h.send_response(code)
+        h.send_header("Content-Type", "application/json; charset=utf-8")
+        h.send_header("Content-Length", str(len(body)))
+        h.end_headers()
+        h.wfile.write(body)
+
+    def _handle(self, h: BaseHTTPRequestHandler) -> None:
+        t0 = time.perf_counter()
+        parts = urlsplit(h.path)
+        q = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        endpoint = parts.path.rsplit("/", 1)[-1]
+        status = 200
+        try:
+            self._sleep()
+            if endpoint not in ("top-headlines", "everything"):
+                status = 404
+                self._send(h, 404, {"status": "error", "code": "notFound", "message": parts.path})
+                return
+            if not q.get("apiKey"):
+                status = 401
+                self._send(h, 401, {"status": "error", "code": "apiKeyMissing", "message": "no key"})
+                return
+            page = int(q.get("page", 1))
+            scope = q.get("category") or q.get("domains") or ""
+            lang = q.get("language") or q.get("country") or ""
+            key = (endpoint, scope, lang, page)
+            err = self._pick_error(key)
+            if err is not None:
+                status = err
+                code, msg = ERROR_MESSAGES.get(err, ("unexpectedError", "error"))
+                self._send(h, err, {"status": "error", "code": code, "message": msg})
+                return
+            size = min(int(q.get("pageSize", 20)), self.max_page_size)
+            arts = self._articles(endpoint, scope, lang, page, size)
+            with self._lock:
+                self.articles_served += len(arts)
+            self._send(h, 200, {"status": "ok", "totalResults": self.articles_per_query, "articles": arts})
+        finally:
+            with self._lock:
+                self.requests.append((endpoint, status, time.perf_counter() - t0))
+
+    def _articles(self, endpoint: str, scope: str, lang: str, page: int, size: int) -> List[Dict]:
+        start = (page - 1) * size
+        out = []
+        domains = [d for d in scope.split(",") if d] or ["example.com"]
+        words = _KO if lang == "ko" else _EN
+        for i in range(start, min(start + size, self.articles_per_query)):
+            shared = (i % max(1, int(1 / self.shared_ratio))) == 0 if self.shared_ratio else False
+            # shared 기사는 언어/질의와 무관하게 같은 제목+URL → 교차 질의 중복/병합 경로를 태움
+            tag = f"shared {i}" if shared else f"{endpoint} {scope} {lang} {i}"
+            domain = domains[i % len(domains)]
+            rnd = random.Random(tag)
+            out.append({
+                "source": {"id": None, "name": domain},
+                "author": None,
+                "title": f"{' '.join(rnd.choices(words, k=6))} #{tag}",
+                "description": " ".join(rnd.choices(words, k=rnd.randint(15, 40))),
+                "url": f"https://{domain.split('/')[0]}/{zlib.crc32(tag.encode('utf-8'))}/{i}",
+                "urlToImage": None,
+                "publishedAt": (self.now - dt.timedelta(minutes=7 * i)).isoformat().replace("+00:00", "Z"),
+                "content": None,
+            })
+        return out
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            reqs = list(self.requests)
+        lat = [r[2] * 1000 for r in reqs]
+        by_status = Counter(str(r[1]) for r in reqs)
+        return {
+            "requests": len(reqs),
+            "by_status": dict(sorted(by_status.items())),
+            "connections": self.connections,
+            "articles_served": self.articles_served,
+            "recovered_after_error": sum(self.recovered.values()),
+            "latency_ms": {"p50": _round(percentile(lat, 50)), "p99": _round(percentile(lat, 99)),
+                           "max": _round(max(lat) if lat else None)},
+        }
+
+
+def _round(v: Optional[float], n: int = 2) -> Optional[float]:
+    return round(v, n) if v is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Fake Firestore
+# ---------------------------------------------------------------------------
+
+def _sentinels():
+    try:
+        from firebase_admin import firestore
+        return firestore.DELETE_FIELD, firestore.SERVER_TIMESTAMP
+    except ModuleNotFoundError:  # pragma: no cover - firebase-admin 없으면 센티널도 쓸 일 없음
+        return object(), object()
+
+
+class _Snapshot:
+    def __init__(self, ref: "_DocRef", data: Optional[Dict]):
+        self.reference = ref
+        self.id = ref.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self) -> Optional[Dict]:
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field: str) -> Any:
+        return (self._data or {}).get(field)
+
+
+class _DocRef:
+    def __init__(self, db: "FakeFirestore", col: str, doc_id: str):
+        self._db, self._col, self.id = db, col, doc_id
+
+    def get(self) -> _Snapshot:
+        self._db._rpc("get")
+        return self._db._snapshot(self)
+
+    def set(self, data: Dict, merge: bool = False) -> None:
+        self._db._rpc("commit")
+        self._db._apply([("set", self, data, merge)])
+
+    def update(self, data: Dict) -> None:
+        self._db._rpc("commit")
+        self._db._apply([("update", self, data, True)])
+
+    def delete(self) -> None:
+        self._db._rpc("commit")
+        self._db._apply([("delete", self, None, False)])
+
+
+_OPS = {
+    "<": lambda a, b: a < b, "<=": lambda a, b: a <= b, ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b, "==": lambda a, b: a == b, "!=": lambda a, b: a != b,
+}
+
+
+class _Query:
+    def __init__(self, db: "FakeFirestore", col: str, filters=(), order: Optional[str] = None,
+                 after: Any = None, limit_n: Optional[int] = None):
+        self._db, self._col = db, col
+        self._filters, self._order, self._after, self._limit = tuple(filters), order, after, limit_n
+
+    def _copy(self, **kw) -> "_Query":
+        d = dict(filters=self._filters, order=self._order, after=self._after, limit_n=self._limit)
+        d.update(kw)
+        return _Query(self._db, self._col, **d)
+
+    def where(self, field_path: Optional[str] = None, op_string: Optional[str] = None, value: Any = None, *,
+              filter: Any = None) -> "_Query":
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field: str, direction: Any = None) -> "_Query":
+        return self._copy(order=field)
+
+    def start_after(self, snap: Any) -> "_Query":
+        return self._copy(after=snap)
+
+    def limit(self, n: int) -> "_Query":
+        return self._copy(limit_n=n)
+
+    def stream(self) -> Iterable[_Snapshot]:
+        self._db._rpc("query")
+        with self._db._lock:
+            docs = list(self._db._data.get(self._col, {}).items())
+        rows = []
+        for doc_id, data in docs:
+            ok = True
+            for f, op, v in self._filters:
+                x = data.get(f)
+                if x is None or not _OPS[op](x, v):
+                    ok = False
+                    break
+            if ok:
+                rows.append((doc_id, data))
+        if self._order:
+            rows = [r for r in rows if self._order in r[1]]
+            rows.sort(key=lambda r: (r[1][self._order], r[0]))
+            if self._after is not None:
+                if isinstance(self._after, _Snapshot):
+                    pos = (self._after.get(self._order), self._after.id)
+                    rows = [r for r in rows if (r[1][self._order], r[0]) > pos]
+                else:
+                    v = self._after.get(self._order)
+                    rows = [r for r in rows if r[1][self._order] > v]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        return [_Snapshot(_DocRef(self._db, self._col, i), copy.deepcopy(d)) for i, d in rows]
+
+    def get(self) -> List[_Snapshot]:
+        return list(self.stream())
+
+
+class _Collection(_Query):
+    def __init__(self, db: "FakeFirestore", col: str):
+        super().__init__(db, col)
+
+    def document(self, doc_id: str) -> _DocRef:
+        return _DocRef(self._db, self._col, doc_id)
+
+
+class _Batch:
+    def __init__(self, db: "FakeFirestore"):
+        self._db = db
+        self._ops: List[Tuple] = []
+
+    def set(self, ref: _DocRef, data: Dict, merge: bool = False) -> None:
+        self._ops.append(("set", ref, data, merge))
+
+    def update(self, ref: _DocRef, data: Dict) -> None:
+        self._ops.append(("update", ref, data, True))
+
+    def delete(self, ref: _DocRef) -> None:
+        self._ops.append(("delete", ref, None, False))
+
+    def commit(self) -> None:
+        if len(self._ops) > 500:
+            raise ValueError("maximum 500 writes allowed per batch")
+        self._db._rpc("commit")
+        self._db._apply(self._ops)
+        self._ops = []
+
+
+class FakeFirestore:
+    """
+    FirestoreStorage / compact / top-K 가 쓰는 만큼의 firestore.Client 대역.
+    RPC 마다 rpc_latency_ms 지연을 넣고 종류별 호출 수를 센다.
+    """
+
+    def __init__(self, rpc_latency_ms: float = 0.0):
+        self.rpc_latency_ms = rpc_latency_ms
+        self._data: Dict[str, Dict[str, Dict]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        self.rpcs: Counter = Counter()
+        self._delete, self._server_ts = _sentinels()
+
+    def _rpc(self, kind: str) -> None:
+        with self._lock:
+            self.rpcs[kind] += 1
+        if self.rpc_latency_ms:
+            time.sleep(self.rpc_latency_ms / 1000.0)
+
+    def _snapshot(self, ref: _DocRef) -> _Snapshot:
+        with self._lock:
+            data = self._data.get(ref._col, {}).get(ref.id)
+            return _Snapshot(ref, copy.deepcopy(data))
+
+    def _apply(self, ops: Iterable[Tuple]) -> None:
+        with self._lock:
+            for kind, ref, data, merge in ops:
+                col = self._data[ref._col]
+                if kind == "delete":
+                    col.pop(ref.id, None)
+                    continue
+                if kind == "update" and ref.id not in col:
+                    raise KeyError(f"No document to update: {ref._col}/{ref.id}")
+                cur = dict(col.get(ref.id) or {}) if merge else {}
+                for k, v in data.items():
+                    if v is self._delete:
+                        cur.pop(k, None)
+                    elif v is self._server_ts:
+                        cur[k] = dt.datetime.now(tz=tz.UTC)
+                    else:
+                        cur[k] = copy.deepcopy(v)
+                col[ref.id] = cur
+
+    def collection(self, name: str) -> _Collection:
+        return _Collection(self, name)
+
+    def get_all(self, refs: Iterable[_DocRef]) -> List[_Snapshot]:
+        self._rpc("get_all")
+        return [self._snapshot(r) for r in refs]
+
+    def batch(self) -> _Batch:
+        return _Batch(self)
+
+    def count(self, collection: str) -> int:
+        with self._lock:
+            return len(self._data.get(collection, {}))
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def _patched(obj: Any, **attrs: Any):
+    old = {k: getattr(obj, k) for k in attrs}
+    for k, v in attrs.items():
+        setattr(obj, k, v)
+    try:
+        yield
+    finally:
+        for k, v in old.items():
+            setattr(obj, k, v)
+
+
+@contextlib.contextmanager
+def _env(**values: str):
+    old = {k: os.environ.get(k) for k in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for k, v in old.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def run_loadtest(*, runs: int = 3, concurrency: int = 1, mode: str = "domains", store: str = "memory",
+                 categories: Sequence[str] = NEWSAPI_CATEGORIES, languages: str = "ko,en",
+                 page_size: int = 100, max_pages: int = 2, articles_per_query: int = 200,
+                 latency_ms: float = 20.0, jitter_ms: float = 5.0, error_rate: float = 0.0,
+                 error_codes: Sequence[int] = (429, 500, 503), max_consecutive_errors: Optional[int] = None,
+                 rpc_latency_ms: float = 0.0, retry_backoff: float = 0.01, seed: int = 0,
+                 workdir: Optional[str] = None, extra_args: Sequence[str] = ()) -> Dict[str, Any]:
+    """
+    가짜 NewsAPI (+ 가짜 Firestore) 를 띄우고 cli.main 을 runs 번 (concurrency 개 스레드로 나눠) 실행.
+    실제 requests/HTTP 경로를 그대로 타므로 재시도/중단 처리와 저장 경로까지 end-to-end 로 잰다.
+    store: memory | sqlite | firestore(FakeFirestore)
+    headlines 모드에서는 4xx(426/429) 주입 시 top-headlines 가 예외를 올리므로 해당 실행은 runs_failed 로 집계된다.
+
+        python -m news_collector.loadtest --runs 5 --concurrency 4 --latency-ms 50 --error-rate 0.05
+    """
+    if store == "sqlite" and concurrency > 1:
+        raise ValueError("sqlite store runs must be sequential (concurrency=1)")
+    tmp = None
+    if workdir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="news-loadtest-")
+        workdir = tmp.name
+
+    argv = ["--store", store, "--categories", *categories, "--page-size", str(page_size),
+            "--max-pages", str(max_pages), *extra_args]
+    if mode == "domains":
+        dom_file = os.path.join(workdir, "domains.json")
+        with open(dom_file, "w", encoding="utf-8") as f:
+            json.dump({c: [f"{c}-a.example.com", f"{c}-b.example.com"] for c in categories}, f)
+        argv += ["--domains-file", dom_file, "--languages", languages]
+    if store == "sqlite":
+        argv += ["--db", os.path.join(workdir, "news.db")]
+
+    fake_db = None
+    firestore_patch: contextlib.AbstractContextManager = contextlib.nullcontext()
+    if store == "firestore":
+        from . import db_firestore
+        fake_db = FakeFirestore(rpc_latency_ms)
+        firestore_patch = _patched(db_firestore, _db=fake_db)
+
+    server = FakeNewsAPI(latency_ms=latency_ms, jitter_ms=jitter_ms, error_rate=error_rate,
+                         error_codes=error_codes, articles_per_query=articles_per_query,
+                         max_consecutive_errors=max_consecutive_errors, seed=seed)
+    run_times: List[float] = []
+    failures: List[str] = []
+    lock = threading.Lock()
+    counter = iter(range(runs))
+
+    def worker() -> None:
+        while True:
+            with lock:
+                if next(counter, None) is None:
+                    return
+            t0 = time.perf_counter()
+            try:
+                cli.main(argv)
+            except Exception as e:  # 실패도 리포트에 포함
+                with lock:
+                    failures.append(f"{type(e).__name__}: {e}")
+            finally:
+                with lock:
+                    run_times.append(time.perf_counter() - t0)
+
+    try:
+        with server, firestore_patch, \
+                _env(NEWSAPI_BASE_URL=server.base_url, NEWSAPI_KEY="loadtest", TQDM_DISABLE="1"), \
+                _patched(api, RETRY_BACKOFF=retry_backoff, PAGE_DELAY=0.0), \
+                contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            t0 = time.perf_counter()
+            threads = [threading.Thread(target=worker, name=f"loadtest-{i}") for i in range(max(1, concurrency))]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            wall = time.perf_counter() - t0
+
+        stored = None
+        if fake_db is not None:
+            stored = fake_db.count("articles")
+        elif store == "sqlite":
+            conn = sqlite3.connect(os.path.join(workdir, "news.db"))
+            try:
+                stored = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            finally:
+                conn.close()
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    srv = server.report()
+
+    return {
+        "config": {"runs": runs, "concurrency": concurrency, "mode": mode, "store": store,
+                   "categories": len(categories), "page_size": page_size, "max_pages": max_pages,
+                   "latency_ms": latency_ms, "error_rate": error_rate, "error_codes": list(error_codes)},
+        "runs_ok": runs - len(failures),
+        "runs_failed": len(failures),
+        "failures": failures[:5],
+        "wall_seconds": round(wall, 3),
+        "run_seconds": {"p50": _round(percentile(run_times, 50), 3), "p99": _round(percentile(run_times, 99), 3),
+                        "mean": _round(statistics.mean(run_times), 3) if run_times else None},
+        "throughput": {"requests_per_sec": round(srv["requests"] / wall, 1) if wall else None,
+                       "articles_per_sec": round(srv["articles_served"] / wall, 1) if wall else None},
+        "server": srv,
+        "stored_articles": stored,
+        "firestore_rpcs": dict(fake_db.rpcs) if fake_db is not None else None,
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Offline load test: fake NewsAPI (+ fake Firestore) -> news_collector.cli")
+    p.add_argument("--runs", type=int, default=3)
+    p.add_argument("--concurrency", type=int, default=1)
+    p.add_argument("--mode", choices=["domains", "headlines"], default="domains")
+    p.add_argument("--store", choices=["memory", "sqlite", "firestore"], default="memory")
+    p.add_argument("--categories", nargs="+", default=NEWSAPI_CATEGORIES)
+    p.add_argument("--languages", default="ko,en")
+    p.add_argument("--page-size", type=int, default=100)
+    p.add_argument("--max-pages", type=int, default=2)
+    p.add_argument("--articles-per-query", type=int, default=200)
+    p.add_argument("--latency-ms", type=float, default=20.0)
+    p.add_argument("--jitter-ms", type=float, default=5.0)
+    p.add_argument("--error-rate", type=float, default=0.0)
+    p.add_argument("--error-codes", type=int, nargs="+", default=[429, 500, 503])
+    p.add_argument("--max-consecutive-errors", type=int)
+    p.add_argument("--rpc-latency-ms", type=float, default=0.0, help="FakeFirestore RPC 지연")
+    p.add_argument("--seed", type=int, default=0)
+    return p.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    a = parse_args(argv)
+    report = run_loadtest(runs=a.runs, concurrency=a.concurrency, mode=a.mode, store=a.store,
+                          categories=a.categories, languages=a.languages, page_size=a.page_size,
+                          max_pages=a.max_pages, articles_per_query=a.articles_per_query,
+                          latency_ms=a.latency_ms, jitter_ms=a.jitter_ms, error_rate=a.error_rate,
+                          error_codes=a.error_codes, max_consecutive_errors=a.max_consecutive_errors,
+                          rpc_latency_ms=a.rpc_latency_ms, seed=a.seed)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import html
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+SUMMARY_MAX_CHARS = 2000
+DETECT_SAMPLE_CHARS = 300
+
+_TAG = re.compile(r"<[^>]{0,200}>")
+_WS = re.compile("[\\s\u200b\u2060\ufeff]+")
+_HANGUL = re.compile("[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]")
+_KANA = re.compile("[\u3040-\u30ff]")
+_HAN = re.compile("[\u4e00-\u9fff]")
+_LATIN = re.compile("[A-Za-z\u00c0-\u024f]")
+_JOINERS = {"\u200d", "\ufe0e", "\ufe0f"}  # ZWJ, variation selectors
+
+
+def truncate_chars(s: str, max_chars: int) -> str:
+    """max_chars 이하로 자르되 결합 문자/ZWJ 시퀀스/서로게이트 중간에서는 자르지 않음."""
+    if len(s) <= max_chars:
+        return s
+    cut = max_chars
+    while cut > 0 and (unicodedata.combining(s[cut]) or s[cut] in _JOINERS or s[cut - 1] == "\u200d"
+                       or "\udc00" <= s[cut] <= "\udfff"):
+        cut -= 1
+    return s[:cut].rstrip()
+
+
+def clean_text(s: Optional[str], max_chars: Optional[int] = None) -> str:
+    """HTML 엔티티/태그 제거, NFC 정규화, 공백 정리, 문자 단위 truncate."""
+    if not s:
+        return ""
+    if max_chars and len(s) > 4 * max_chars:
+        # 정리해도 max_chars 는 넘을 만큼만 앞부분을 잘라서 처리 (긴 본문 전체를 정규식에 태우지 않음)
+        head = clean_text(s[:4 * max_chars], max_chars)
+        if len(head) >= max_chars:
+            return head
+    if "&" in s:
+        s = html.unescape(s)
+    if "<" in s:
+        s = _TAG.sub(" ", s)
+    if not s.isascii() and not unicodedata.is_normalized("NFC", s):
+        s = unicodedata.normalize("NFC", s)
+    s = _WS.sub(" ", s).strip()
+    return truncate_chars(s, max_chars) if max_chars else s
+
+
+def detect_lang(text: str, sample: int = DETECT_SAMPLE_CHARS) -> Optional[str]:
+    """
+    문자 체계 비율로 보는 빠른 로컬 언어 판별 (ko/ja/zh/en).
+    앞 sample 자만 본다. 한글이 글자의 30% 이상이면 ko. 판단할 글자가 없으면 None.
+    """
+    text = text[:sample]
+    hangul = len(_HANGUL.findall(text))
+    kana = len(_KANA.findall(text))
+    han = len(_HAN.findall(text))
+    latin = len(_LATIN.findall(text))
+    total = hangul + kana + han + latin
+    if not total:
+        return None
+    if hangul / total >= 0.3:
+        return "ko"
+    if kana / total >= 0.1:
+        return "ja"
+    if han / total >= 0.3:
+        return "zh"
+    if latin / total >= 0.5:
+        return "en"
+    return None
+
+
+def normalize_batch(items: List[Dict], summary_max: int = SUMMARY_MAX_CHARS) -> List[Dict]:
+    """
+    수집 아이템 일괄 정규화.
+    - title/summary 정리 (summary 는 summary_max 자)
+    - lang: 제목+요약으로 판별, 실패 시 요청 언어(req_lang)
+    - 같은 id 가 여러 언어 요청에서 왔으면 판별 언어와 요청 언어가 일치하는 쪽 하나만 남김
+    """
+    out: Dict[str, Dict] = {}
+    for a in items:
+        a["title"] = clean_text(a.get("title")) or a.get("title")
+        a["summary"] = clean_text(a.get("summary"), summary_max)
+        a["lang"] = detect_lang(f"{a['title'] or ''} {a['summary']}") or a.get("req_lang")
+        prev = out.get(a["id"])
+        if prev is None or (prev.get("req_lang") != prev["lang"] and a.get("req_lang") == a["lang"]):
+            out[a["id"]] = a
+    return list(out.values())
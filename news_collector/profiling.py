@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from typing import Dict, Iterator, List, Optional
+
+PROFILE_MODES = ["cpu", "mem"]
+
+_active: Optional["Profiler"] = None
+
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    """수집 단계 구간 표시 (fetch/normalize/filter/save/export ...). 프로파일러가 없으면 아무 일도 안 함."""
+    p = _active
+    if p is None:
+        yield
+        return
+    with p.stage(name):
+        yield
+
+
+class Profiler:
+    """
+    --profile cpu: cProfile(pstats) + 샘플링 스택(flamegraph collapsed 형식, 루트 프레임은 stage:<이름>)
+    --profile mem: tracemalloc, 단계 시작/끝 스냅샷 차이를 단계별로 합산한 top allocations
+    두 모드 모두 단계별 소요 시간(stages.json)을 남긴다.
+    """
+
+    def __init__(self, mode: str, out_dir: str, *, interval: float = 0.005, top: int = 25, frames: int = 25):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unknown profile mode: {mode}")
+        self.mode = mode
+        self.out_dir = out_dir
+        self.interval = interval
+        self.top = top
+        self.frames = frames
+        self._stack: List[str] = []
+        self._timings: Dict[str, Dict[str, float]] = defaultdict(lambda: {"calls": 0, "seconds": 0.0})
+        self._samples: Counter = Counter()
+        self._mem: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+        self._prof: Optional[cProfile.Profile] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._thread_id = 0
+        self._started = 0.0
+
+    # ---------- lifecycle ----------
+
+    def start(self) -> "Profiler":
+        global _active
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._thread_id = threading.get_ident()
+        self._started = time.perf_counter()
+        if self.mode == "cpu":
+            self._prof = cProfile.Profile()
+            self._sampler = threading.Thread(target=self._sample_loop, name="profile-sampler", daemon=True)
+            self._sampler.start()
+            self._prof.enable()
+        else:
+            tracemalloc.start(self.frames)
+        _active = self
+        return self
+
+    def stop(self) -> Dict[str, str]:
+        """결과 파일을 쓰고 {종류: 경로} 반환."""
+        global _active
+        _active = None
+        total = time.perf_counter() - self._started
+        out: Dict[str, str] = {}
+        if self.mode == "cpu":
+            self._prof.disable()
+            self._stop.set()
+            self._sampler.join()
+            out["pstats"] = os.path.join(self.out_dir, "cpu.pstats")
+            self._prof.dump_stats(out["pstats"])
+            out["collapsed"] = os.path.join(self.out_dir, "cpu.collapsed")
+            with open(out["collapsed"], "w", encoding="utf-8") as f:
+                for stack, n in sorted(self._samples.items()):
+                    f.write(f"{stack} {n}\n")
+        else:
+            current, peak = tracemalloc.get_traced_memory()
+            final = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            out["mem_top"] = os.path.join(self.out_dir, "mem_top.txt")
+            self._write_mem_report(out["mem_top"], final, current, peak)
+        out["stages"] = os.path.join(self.out_dir, "stages.json")
+        with open(out["stages"], "w", encoding="utf-8") as f:
+            json.dump({"total_seconds": round(total, 4),
+                       "stages": {k: {"calls": int(v["calls"]), "seconds": round(v["seconds"], 4)}
+                                  for k, v in self._timings.items()}}, f, indent=2)
+        return out
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ---------- stages ----------
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        before = tracemalloc.take_snapshot() if self.mode == "mem" else None
+        self._stack.append(name)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t0
+            self._stack.pop()
+            self._timings[name]["calls"] += 1
+            self._timings[name]["seconds"] += dt
+            if before is not None:
+                after = tracemalloc.take_snapshot()
+                acc = self._mem[name]
+                for st in after.compare_to(before, "lineno"):
+                    if st.size_diff or st.count_diff:
+                        key = str(st.traceback[0])
+                        acc[key][0] += st.size_diff
+                        acc[key][1] += st.count_diff
+
+    # ---------- cpu sampling ----------
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            names: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            names.reverse()
+            root = f"stage:{self._stack[-1]}" if self._stack else "stage:-"
+            self._samples[";".join([root] + names)] += 1
+
+    # ---------- mem report ----------
+
+    def _write_mem_report(self, path: str, final: tracemalloc.Snapshot, current: int, peak: int) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"current={current / 1024:.1f} KiB peak={peak / 1024:.1f} KiB\n\n")
+            for name, acc in self._mem.items():
+                f.write(f"== stage {name} (net allocations, summed over {int(self._timings[name]['calls'])} calls)\n")
+                for key, (size, count) in sorted(acc.items(), key=lambda kv: -abs(kv[1][0]))[:self.top]:
+                    f.write(f"{size / 1024:+10.1f} KiB {count:+8d} blocks  {key}\n")
+                f.write("\n")
+            f.write("== live at end (top)\n")
+            for st in final.statistics("lineno")[:self.top]:
+                f.write(f"{st.size / 1024:10.1f} KiB {st.count:8d} blocks  {st.traceback[0]}\n")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+import json
+import math
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from dateutil import tz, parser as dtparse
+
+_TITLE_TAIL = re.compile(r"\s+[-|–—]\s+[^-|–—]+$")  # "제목 - 언론사" 꼬리 제거
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def title_key(title: Optional[str]) -> str:
+    """교차 출처 중복 판별용 제목 정규화."""
+    t = _TITLE_TAIL.sub("", title or "")
+    return _NON_WORD.sub("", t).lower()
+
+
+def parse_published(published: Optional[str]) -> Optional[dt.datetime]:
+    """ISO8601 발행 시각 (tz 없으면 UTC). 없거나 깨졌으면 None."""
+    if not published:
+        return None
+    try:
+        t = dtparse.isoparse(published)
+    except Exception:
+        return None
+    return t if t.tzinfo else t.replace(tzinfo=tz.UTC)
+
+
+def duplicate_counts(items: Iterable[Dict]) -> Dict[str, int]:
+    """title_key 별로 서로 다른 source 수."""
+    sources: Dict[str, set] = {}
+    for a in items:
+        k = title_key(a.get("title"))
+        if k:
+            sources.setdefault(k, set()).add((a.get("source") or "").lower())
+    return {k: len(v) for k, v in sources.items()}
+
+
+class Scorer:
+    """
+    기사 점수 = 2^(-age/half_life) * source 가중치 * lang 가중치 * (1 + log2(중복 출처 수)).
+    저장/비교는 log2 공간의 "시간 불변" 키로 한다:
+        key = published_hours / half_life + log2(가중치들)
+    now 가 바뀌어도 순서가 그대로라서 이전 실행에서 저장한 점수와 바로 비교 가능.
+    발행 시각이 없는 기사는 수집 시각에서 undated_age_hours 만큼 뺀 시각으로 취급.
+    이 점수는 실행할 때마다 커지므로 영속 top-K 에는 넣지 않는다 (parse_published 로 걸러냄).
+    """
+
+    def __init__(self, *, half_life_hours: float = 12.0, source_weights: Optional[Mapping[str, float]] = None,
+                 lang_weights: Optional[Mapping[str, float]] = None, undated_age_hours: float = 48.0):
+        self.half_life_hours = half_life_hours
+        self.source_weights = {k.lower(): v for k, v in (source_weights or {}).items()}
+        self.lang_weights = dict(lang_weights or {})
+        self.undated_age_hours = undated_age_hours
+
+    @classmethod
+    def from_file(cls, path: str) -> "Scorer":
+        with open(path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+        return cls(**cfg)
+
+    def _hours(self, published: Optional[str], now: dt.datetime) -> float:
+        t = parse_published(published) or now - dt.timedelta(hours=self.undated_age_hours)
+        return t.timestamp() / 3600.0
+
+    def score(self, a: Dict, dup: int = 1, now: Optional[dt.datetime] = None) -> float:
+        now = now or dt.datetime.now(tz=tz.UTC)
+        w = (self.source_weights.get((a.get("source") or "").lower(), 1.0)
+             * self.lang_weights.get(a.get("lang") or "", 1.0)
+             * (1.0 + math.log2(max(1, dup))))
+        return self._hours(a.get("published"), now) / self.half_life_hours + math.log2(max(w, 1e-9))
+
+    def rank(self, items: List[Dict], now: Optional[dt.datetime] = None) -> List[Dict]:
+        """id 기준 중복 제거 후 점수 내림차순. 각 기사에 a["score"] 기록."""
+        now = now or dt.datetime.now(tz=tz.UTC)
+        dups = duplicate_counts(items)
+        out: List[Dict] = []
+        seen = set()
+        for a in items:
+            if a["id"] in seen:
+                continue
+            seen.add(a["id"])
+            a["score"] = self.score(a, dups.get(title_key(a.get("title")), 1), now)
+            out.append(a)
+        out.sort(key=lambda x: x["score"], reverse=True)
+        return out
+
+
+def merge_topk(current: Iterable[Tuple[float, str]], candidates: Iterable[Tuple[float, str]],
+               k: int) -> List[Tuple[float, str]]:
+    """
+    (score, id) 최소 힙으로 상위 k 개 유지. 같은 id 는 높은 점수 하나만.
+    반환: 점수 내림차순.
+    """
+    best: Dict[str, float] = {}
+    for s, i in current:
+        best[i] = max(s, best.get(i, s))
+    for s, i in candidates:
+        best[i] = max(s, best.get(i, s))
+    heap: List[Tuple[float, str]] = []
+    for i, s in best.items():
+        if len(heap) < k:
+            heapq.heappush(heap, (s, i))
+        elif s > heap[0][0]:
+            heapq.heapreplace(heap, (s, i))
+    return sorted(heap, reverse=True)
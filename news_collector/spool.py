@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: 프로세스 간 잠금 없음
+    fcntl = None
+
+from .storage import Storage
+
+SEGMENT_PREFIX = "seg-"
+SEGMENT_SUFFIX = ".jsonl"
+CURSOR_FILE = "cursor.json"
+LOCK_FILE = "consumer.lock"
+
+
+class SpoolBusy(RuntimeError):
+    """다른 프로세스가 같은 스풀을 drain 중."""
+
+
+class Spool:
+    """
+    수집 -> 저장 사이의 append-only 로컬 스풀 (write-ahead log).
+    - 기사 1건 = JSONL 1줄, 세그먼트 파일(seg-000001.jsonl ...)에 순서대로 추가
+    - fsync_every 건마다 fsync (flush()/close() 시에도 fsync)
+    - cursor.json 에 저장 완료 위치(세그먼트, 바이트 오프셋)를 원자적으로 기록
+    - 다 소비된 세그먼트는 삭제
+    - drain/commit 은 consumer.lock 에 flock 을 잡는다 (소비자는 프로세스 하나만, 커서가 뒤로 가지 않게)
+    """
+
+    def __init__(self, path: str, *, fsync_every: int = 64, segment_bytes: int = 8 * 1024 * 1024):
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.segment_bytes = segment_bytes
+        os.makedirs(path, exist_ok=True)
+        self._fh = None
+        self._unsynced = 0
+        self._lock_fh = None
+        self._lock_depth = 0
+        self.corrupt = 0  # pending() 에서 디코딩 못 해 건너뛴 줄 수 (누적)
+
+    # ---------- consumer lock ----------
+
+    @contextlib.contextmanager
+    def _consumer_lock(self, blocking: bool) -> Iterator[None]:
+        """같은 프로세스 안에서는 재진입 가능. blocking=False 면 이미 잡혀 있을 때 SpoolBusy."""
+        if self._lock_depth == 0:
+            fh = open(os.path.join(self.path, LOCK_FILE), "a")
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except BlockingIOError:
+                    fh.close()
+                    raise SpoolBusy(f"spool {self.path} is being drained by another process") from None
+            self._lock_fh = fh
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                self._lock_fh.close()  # close 로 flock 해제
+                self._lock_fh = None
+
+    # ---------- segments / cursor ----------
+
+    def _segments(self) -> List[int]:
+        out = []
+        for name in os.listdir(self.path):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                try:
+                    out.append(int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(out)
+
+    def _segment_path(self, seq: int) -> str:
+        return os.path.join(self.path, f"{SEGMENT_PREFIX}{seq:06d}{SEGMENT_SUFFIX}")
+
+    def _read_cursor(self) -> Tuple[int, int]:
+        try:
+            with open(os.path.join(self.path, CURSOR_FILE), "r", encoding="utf-8") as f:
+                c = json.load(f)
+            return int(c["segment"]), int(c["offset"])
+        except (FileNotFoundError, ValueError, KeyError):
+            return 0, 0
+
+    def _write_cursor(self, segment: int, offset: int) -> None:
+        tmp = os.path.join(self.path, CURSOR_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"segment": segment, "offset": offset}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.path, CURSOR_FILE))
+
+    # ---------- producer ----------
+
+    def _open_for_append(self):
+        if self._fh is not None and self._fh.tell() < self.segment_bytes:
+            return self._fh
+        if self._fh is not None:
+            self.flush()
+            self._fh.close()
+            seq = self._segments()[-1] + 1
+        else:
+            segs = self._segments()
+            seq = segs[-1] if segs else 1
+            if segs and os.path.getsize(self._segment_path(seq)) >= self.segment_bytes:
+                seq += 1
+        self._fh = open(self._segment_path(seq), "ab")
+        self._truncate_torn_tail(self._fh)
+        return self._fh
+
+    @staticmethod
+    def _truncate_torn_tail(fh) -> None:
+        # 이전 프로세스가 줄 중간에서 죽었으면 마지막 개행 이후를 잘라 다음 레코드와 섞이지 않게 함
+        size = fh.seek(0, os.SEEK_END)
+        if not size:
+            return
+        with open(fh.name, "rb") as r:
+            r.seek(max(0, size - 65536))
+            tail = r.read()
+        if tail.endswith(b"\n"):
+            return
+        cut = tail.rfind(b"\n")
+        keep = size - len(tail) + cut + 1 if cut >= 0 else (0 if size <= 65536 else size)
+        if keep != size:
+            fh.truncate(keep)
+            fh.seek(keep)
+
+    def append(self, a: Dict) -> None:
+        fh = self._open_for_append()
+        fh.write(json.dumps(a, ensure_ascii=False).encode("utf-8") + b"\n")
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self.flush()
+
+    def extend(self, items: List[Dict]) -> None:
+        for a in items:
+            self.append(a)
+        self.flush()
+
+    def flush(self) -> None:
+        if self._fh is not None and self._unsynced:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self.flush()
+            self._fh.close()
+            self._fh = None
+
+    # ---------- consumer ----------
+
+    def pending(self) -> Iterator[Tuple[int, int, Dict]]:
+        """
+        커서 이후의 (segment, 다음 오프셋, article). 개행 없는 마지막 줄(쓰다 죽은 레코드)은 건너뜀.
+        JSON 으로 읽을 수 없는 줄은 self.corrupt 에 세고 stderr 에 위치를 남긴 뒤 건너뜀.
+        """
+        self.flush()
+        cur_seg, cur_off = self._read_cursor()
+        for seq in self._segments():
+            if seq < cur_seg:
+                continue
+            with open(self._segment_path(seq), "rb") as f:
+                if seq == cur_seg:
+                    f.seek(cur_off)
+                while True:
+                    start = f.tell()
+                    line = f.readline()
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        a = json.loads(line)
+                    except ValueError:
+                        self.corrupt += 1
+                        print(f"[Spool] skipped undecodable record at {self._segment_path(seq)}:{start}",
+                              file=sys.stderr)
+                        continue
+                    yield seq, f.tell(), a
+
+    def commit(self, segment: int, offset: int) -> None:
+        with self._consumer_lock(blocking=True):
+            if (segment, offset) < self._read_cursor():
+                return  # 다른 소비자가 이미 더 앞까지 커밋함 → 되돌리지 않음
+            self._write_cursor(segment, offset)
+            active = self._fh.name if self._fh is not None else None
+            for seq in self._segments():
+                p = self._segment_path(seq)
+                if seq < segment and p != active:
+                    os.remove(p)
+
+    def drain(self, storage: Storage, *, batch_size: int = 100,
+              on_batch: Optional[Callable[[List[Dict], List[bool]], None]] = None) -> Dict[str, int]:
+        """
+        스풀에 남은 기사를 storage.save_many 로 batch_size 건씩 저장하고 배치마다 커서 커밋.
+        다른 프로세스가 drain 중이면 바로 SpoolBusy. 반환의 corrupt 는 이번에 건너뛴 깨진 줄 수.
+        """
+        with self._consumer_lock(blocking=False):
+            return self._drain(storage, batch_size, on_batch)
+
+    def _drain(self, storage: Storage, batch_size: int,
+               on_batch: Optional[Callable[[List[Dict], List[bool]], None]]) -> Dict[str, int]:
+        saved = skipped = 0
+        corrupt_before = self.corrupt
+        batch: List[Dict] = []
+        last: Optional[Tuple[int, int]] = None
+
+        def flush_batch() -> None:
+            nonlocal saved, skipped
+            flags = storage.save_many(batch)
+            saved += sum(flags)
+            skipped += len(flags) - sum(flags)
+            if on_batch:
+                on_batch(batch, flags)
+            self.commit(*last)
+            batch.clear()
+
+        for seq, off, a in self.pending():
+            batch.append(a)
+            last = (seq, off)
+            if len(batch) >= batch_size:
+                flush_batch()
+        if batch:
+            flush_batch()
+        return {"saved": saved, "skipped": skipped, "count": saved + skipped, "corrupt": self.corrupt - corrupt_before}
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.pending())
+
+    def __enter__(self) -> "Spool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Set, runtime_checkable
+
+STORES = ["sqlite", "firestore", "memory"]
+
+
+@runtime_checkable
+class Storage(Protocol):
+    """
+    저장 백엔드 공통 인터페이스 (배치 단위).
+    - save_many: 입력 순서대로 True=신규, False=기존(categories 병합)
+    - existing_ids: 이미 저장된 id 집합
+    - merge_categories: 기존 문서들의 categories 에 cat 추가, 실제로 바뀐 id 목록 반환
+    """
+
+    def open(self) -> None: ...
+
+    def close(self) -> None: ...
+
+    def save_many(self, items: Sequence[Dict]) -> List[bool]: ...
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]: ...
+
+    def merge_categories(self, ids: Iterable[str], category: str) -> List[str]: ...
+
+
+@runtime_checkable
+class AsyncStorage(Protocol):
+    async def open(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def save_many(self, items: Sequence[Dict]) -> List[bool]: ...
+
+    async def existing_ids(self, ids: Iterable[str]) -> Set[str]: ...
+
+    async def merge_categories(self, ids: Iterable[str], category: str) -> List[str]: ...
+
+
+class AsyncStorageAdapter:
+    """
+    동기 Storage -> AsyncStorage.
+    모든 호출을 전용 워커 스레드 1개에서 실행 (sqlite3 커넥션은 생성한 스레드에서만 사용 가능).
+    asyncio 로 저장소를 쓰는 호출자용이며, collector 의 수집 파이프라인은 아직 동기(카테고리별 순차 저장)로 쓴다.
+    """
+
+    def __init__(self, storage: Storage):
+        self.storage = storage
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage")
+
+    async def _call(self, fn: Callable, *args: Any):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def open(self) -> None:
+        await self._call(self.storage.open)
+
+    async def close(self) -> None:
+        try:
+            await self._call(self.storage.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def save_many(self, items: Sequence[Dict]) -> List[bool]:
+        return await self._call(self.storage.save_many, list(items))
+
+    async def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        return await self._call(self.storage.existing_ids, list(ids))
+
+    async def merge_categories(self, ids: Iterable[str], category: str) -> List[str]:
+        return await self._call(self.storage.merge_categories, list(ids), category)
+
+
+class CallbackStorage:
+    """
+    기존 save_article(conn, a) 스타일 함수를 Storage 로 감싸는 어댑터 (하위 호환용).
+    단건 함수로는 조회가 안 되므로 이번 프로세스에서 저장한 기사만 알고 있다 (existing_ids / merge_categories).
+    """
+
+    def __init__(self, save_fn: Callable[[Any, Dict], bool], conn: Any):
+        self.save_fn = save_fn
+        self.conn = conn
+        self._seen: Dict[str, Dict] = {}
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def save_many(self, items: Sequence[Dict]) -> List[bool]:
+        flags = [bool(self.save_fn(self.conn, a)) for a in items]
+        self._seen.update((a["id"], a) for a in items)
+        return flags
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        return {i for i in ids if i in self._seen}
+
+    def merge_categories(self, ids: Iterable[str], category: str) -> List[str]:
+        # save_fn 은 기존 기사면 categories 를 병합하므로, 저장했던 기사를 category 만 바꿔 다시 넘긴다.
+        # 병합 전 상태는 알 수 없으므로 다시 넘긴 id 를 그대로 반환
+        merged = []
+        for i in ids:
+            a = self._seen.get(i)
+            if a is not None:
+                self.save_fn(self.conn, {**a, "category": category})
+                merged.append(i)
+        return merged
+
+
+def chunked(seq: Sequence, size: int) -> Iterable[Sequence]:
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+
+def open_storage(name: str, path: Optional[str] = None, *, outbox: bool = False) -> Storage:
+    """이름으로 백엔드 생성 후 open() 까지 호출해서 반환. outbox 는 sqlite 의 같은 DB 안 outbox 테이블."""
+    if name == "firestore":
+        try:
+            from news_collector.db_firestore import FirestoreStorage
+        except ModuleNotFoundError as e:
+            raise RuntimeError(
+                "Firestore backend requires 'firebase-admin' package. Install with: pip install firebase-admin") from e
+        st: Storage = FirestoreStorage()
+    elif name == "memory":
+        from news_collector.db_memory import MemoryStorage
+        st = MemoryStorage()
+    elif name == "sqlite":
+        from news_collector.db import SQLiteStorage
+        st = SQLiteStorage(path, outbox=outbox) if path else SQLiteStorage(outbox=outbox)
+    else:
+        raise ValueError(f"unknown store: {name}")
+    st.open()
+    return st
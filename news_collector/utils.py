@@ -1,6 +1,6 @@
 from __future__ import annotations
 import hashlib
-from typing import Optional
+from typing import Any, Optional
 from dateutil import tz, parser as dtparse
 
 
@@ -21,3 +21,13 @@ def norm_time(dt_str: Optional[str]) -> Optional[str]:
         return d.astimezone(tz.UTC).isoformat()
     except Exception:
         return None
+
+
+def extract_image_url(raw: Any) -> Optional[str]:
+    """NewsAPI 원본에서 대표 이미지 URL 추출."""
+    if isinstance(raw, dict):
+        for k in ("urlToImage", "imageUrl", "image_url"):
+            v = raw.get(k)
+            if isinstance(v, str) and v.strip():
+                return v.strip()
+    return None
@@ -16,6 +16,8 @@ import firebase_admin
 from dateutil import parser as dtparse
 from firebase_admin import credentials, firestore
 
+from news_collector.utils import extract_image_url
+
 BATCH_LIMIT = 450  # Firestore write batch ≤ 500, 여유 있게
 
 
@@ -52,15 +54,6 @@ def parse_ts(iso_str: Optional[str]):
         return None
 
 
-def extract_image_url(raw: Any) -> Optional[str]:
-    if isinstance(raw, dict):
-        for k in ("urlToImage", "imageUrl", "image_url"):
-            v = raw.get(k)
-            if isinstance(v, str) and v.strip():
-                return v.strip()
-    return None
-
-
 def ensure_categories_array(doc: Dict[str, Any]):
     # 기존에 categories가 string이거나 None일 수 있음 → array로 표준화
     cats = doc.get("categories")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+normalize_batch 처리량 벤치마크 (합성 ko/en 기사).
+    python scripts/bench_normalize.py --n 100000
+"""
+
+import argparse
+import random
+import time
+
+from news_collector.normalize import normalize_batch
+
+KO = ["정부", "삼성전자", "반도체", "수출", "증가", "발표", "서울", "경제", "&quot;속보&quot;", "<b>단독</b>"]
+EN = ["Government", "Samsung", "chip", "exports", "rise", "announced", "Seoul", "economy", "&amp;", "<i>update</i>"]
+
+
+def make_items(n: int, seed: int = 0):
+    rnd = random.Random(seed)
+    items = []
+    for i in range(n):
+        words = KO if i % 2 else EN
+        items.append({
+            "id": f"id{i}",
+            "title": " ".join(rnd.choices(words, k=10)),
+            "summary": "  ".join(rnd.choices(words, k=rnd.randint(20, 60))),  # NewsAPI description 정도
+            "req_lang": "ko" if i % 3 else "en",
+        })
+    return items
+
+
+def main():
+    p = argparse.ArgumentParser(description="normalize_batch throughput")
+    p.add_argument("--n", type=int, default=100_000)
+    args = p.parse_args()
+
+    items = make_items(args.n)
+    t0 = time.perf_counter()
+    out = normalize_batch(items)
+    elapsed = time.perf_counter() - t0
+    langs = {}
+    for a in out:
+        langs[a["lang"]] = langs.get(a["lang"], 0) + 1
+    print(f"n={args.n} elapsed={elapsed:.2f}s rate={args.n / elapsed:,.0f} articles/s langs={langs}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import datetime as dt
+
 import pytest
 
 
@@ -15,4 +17,19 @@ def mem_db(monkeypatch, tmp_path):
     # 필요 시 monkeypatch로 함수 대체도 가능
     # 여기선 그냥 테스트마다 새 DB 파일을 씀
     db_path = tmp_path / "test.db"
-    yield str(db_path)
\ No newline at end of file
+    yield str(db_path)
+
+
+def _article(i, category="technology", *, published="2025-08-01T00:00:00+00:00", **fields):
+    """테스트용 수집 아이템. published 는 ISO 문자열/datetime/None, 나머지 필드는 덮어쓰기."""
+    if isinstance(published, dt.datetime):
+        published = published.isoformat()
+    a = {"id": f"id{i}", "title": f"t{i}", "url": f"u{i}", "source": "s", "published": published,
+         "summary": "s", "category": category, "raw": {"i": i}}
+    a.update(fields)
+    return a
+
+
+@pytest.fixture
+def make_article():
+    return _article
@@ -1,3 +1,5 @@
+import pytest
+import requests
 import responses
 from news_collector.api import fetch_top_headlines_category, fetch_everything_by_domains
 
@@ -35,3 +37,28 @@ def test_fetch_everything_by_domains_pagination_stop_on_426():
     items = fetch_everything_by_domains("KEY", domains_csv="chosun.com", language="ko", max_pages=2, page_size=100,
                                         debug=True)
     assert len(items) == 1  # 2페이지에서 멈춤
+
+
+@responses.activate
+def test_fetch_everything_retries_5xx(monkeypatch):
+    import news_collector.api as api
+    monkeypatch.setattr(api, "RETRY_BACKOFF", 0)
+    monkeypatch.setattr(api, "PAGE_DELAY", 0)
+    responses.add(responses.GET, "https://newsapi.org/v2/everything", json={"status": "error"}, status=503)
+    responses.add(
+        responses.GET, "https://newsapi.org/v2/everything",
+        json={"status": "ok", "articles": [
+            {"source": {"name": "X"}, "title": "A", "url": "https://x/a", "publishedAt": "2025-08-01T00:00:00Z"}]},
+        status=200
+    )
+    items = fetch_everything_by_domains("KEY", domains_csv="chosun.com", language="ko", max_pages=1, page_size=100)
+    assert len(items) == 1
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_fetch_top_headlines_raises_on_401():
+    responses.add(responses.GET, "https://newsapi.org/v2/top-headlines",
+                  json={"status": "error", "code": "apiKeyInvalid"}, status=401)
+    with pytest.raises(requests.HTTPError):
+        fetch_top_headlines_category("BAD", "technology", country="us", page_size=100, max_pages=1)
@@ -1,6 +1,8 @@
 import json
 from types import SimpleNamespace
 
+import pytest
+
 from news_collector import cli
 
 
@@ -30,3 +32,17 @@ def test_cli_runs_domains_mode(monkeypatch, tmp_path):
     # run_once 직접 호출
     cli.run_once(args)
     # 별도의 assert는 생략(에러 없이 완료되는지 확인)
+
+
+def test_parse_args_shared_options_before_or_after_subcommand():
+    a = cli.parse_args(["--store", "firestore", "--db", "x.db", "drain", "--spool-dir", "d"])
+    assert (a.store, a.db, a.spool_dir) == ("firestore", "x.db", "d")
+    b = cli.parse_args(["--spool-dir", "d", "drain", "--store", "memory"])
+    assert (b.store, b.db, b.spool_dir) == ("memory", "news.db", "d")
+    c = cli.parse_args(["compact", "--drop-days", "30"])
+    assert (c.store, c.db) == ("sqlite", "news.db")
+
+
+def test_parse_args_drain_requires_spool_dir():
+    with pytest.raises(SystemExit):
+        cli.parse_args(["drain"])
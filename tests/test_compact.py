@@ -0,0 +1,109 @@
+import datetime as dt
+
+import pytest
+from dateutil import tz
+
+from news_collector import cli
+from news_collector.compact import Budget, run_compact
+from news_collector.db import SQLiteStorage
+from news_collector.db_firestore import FirestoreStorage, firestore
+from news_collector.loadtest import FakeFirestore
+
+NOW = dt.datetime(2025, 9, 1, tzinfo=tz.UTC)
+BIG_RAW = {"content": "x" * 4000}
+
+
+def test_compact_sqlite_drops_strips_and_vacuums(tmp_path, make_article):
+    st = SQLiteStorage(str(tmp_path / "db.sqlite"))
+    st.open()
+    st.save_many([make_article(i, published=NOW - dt.timedelta(days=d), raw=BIG_RAW)
+                  for i, d in enumerate([1, 3, 10, 40, 50, 60])])
+
+    res = run_compact(st, drop_days=30, strip_days=7, now=NOW, vacuum="full")
+    assert (res["deleted"], res["stripped"], res["complete"]) == (3, 1, True)
+    assert res["reclaimed_bytes"] > 0
+    rows = dict(st.conn.execute("SELECT id, raw_json FROM articles").fetchall())
+    assert set(rows) == {"id0", "id1", "id2"}
+    assert rows["id2"] is None and rows["id0"] is not None
+    assert st.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    # 두 번째 실행은 할 일 없음 (incremental_vacuum 경로)
+    res = run_compact(st, drop_days=30, strip_days=7, now=NOW)
+    assert (res["deleted"], res["stripped"]) == (0, 0)
+    st.close()
+
+
+def test_compact_respects_time_budget(tmp_path, make_article):
+    st = SQLiteStorage(str(tmp_path / "db.sqlite"))
+    st.open()
+    st.save_many([make_article(i, published=NOW - dt.timedelta(days=40), raw=BIG_RAW) for i in range(5)])
+    res = st.compact(drop_before=NOW, strip_before=None, vacuum="none",
+                     budget=Budget(1e-9))
+    assert res["deleted"] == 0 and res["complete"] is False
+    st.close()
+
+
+class _Steps(Budget):
+    """exhausted() 를 n 번까지만 False 로 돌려주는 예산."""
+
+    def __init__(self, n):
+        super().__init__()
+        self.n = n
+
+    def exhausted(self):
+        self.n -= 1
+        return self.n < 0
+
+
+def test_incremental_vacuum_does_not_convert_and_hints(tmp_path, make_article):
+    st = SQLiteStorage(str(tmp_path / "db.sqlite"))
+    st.open()
+    st.save_many([make_article(i, published=NOW - dt.timedelta(days=40), raw=BIG_RAW) for i in range(5)])
+    res = run_compact(st, drop_days=30, strip_days=None, now=NOW)
+    assert res["deleted"] == 5 and "vacuum full" in res["hint"]
+    assert st.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    st.close()
+
+
+def test_incremental_vacuum_steps_within_budget(tmp_path, make_article):
+    st = SQLiteStorage(str(tmp_path / "db.sqlite"))
+    st.open()
+    st.compact(drop_before=None, strip_before=None, vacuum="full")  # 빈 DB 를 incremental 로 전환
+    st.save_many([make_article(i, published=NOW - dt.timedelta(days=40), raw=BIG_RAW) for i in range(50)])
+    st.compact(drop_before=NOW, strip_before=None, vacuum="none")
+    free = st.conn.execute("PRAGMA freelist_count").fetchone()[0]
+    assert free > 2
+
+    assert st._incremental_vacuum(_Steps(1), step=1) is False  # 한 스텝 후 예산 끝
+    assert st.conn.execute("PRAGMA freelist_count").fetchone()[0] == free - 1
+    res = st.compact(drop_before=None, strip_before=None, vacuum="incremental")
+    assert res["complete"] is True and res["reclaimed_bytes"] > 0
+    assert st.conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+    st.close()
+
+
+def test_cli_compact_rejects_memory_store():
+    with pytest.raises(SystemExit):
+        cli.parse_args(["compact", "--store", "memory"])
+    with pytest.raises(SystemExit):
+        cli.parse_args(["--store", "memory", "compact"])
+
+
+def test_firestore_strip_resumes_from_watermark(make_article):
+    fake = FakeFirestore()
+    st = FirestoreStorage(db=fake)
+    old = dt.datetime(2025, 6, 1, tzinfo=tz.UTC)
+    # 이미 raw_json 이 제거된 문서 1200개 (한 번의 예산으로는 다 못 읽음) + 새로 보존 기간이 지난 문서 10개
+    st.save_many([make_article(i, published=old + dt.timedelta(minutes=i)) for i in range(1200)])
+    for i in range(1200):
+        fake.collection("articles").document(f"id{i}").update({"raw_json": firestore.DELETE_FIELD})
+    st.save_many([make_article(1000 + i, published=old + dt.timedelta(days=30, minutes=i)) for i in range(10)])
+
+    fake.rpc_latency_ms = 50
+    strip_before = NOW - dt.timedelta(days=7)
+    first = st.compact(drop_before=None, strip_before=strip_before, budget=Budget(0.15))
+    assert first["stripped"] == 0 and first["complete"] is False
+    second = st.compact(drop_before=None, strip_before=strip_before, budget=Budget(0.15))
+    assert second["stripped"] == 10
+    assert all("raw_json" not in fake.collection("articles").document(f"id{1000 + i}").get().to_dict()
+               for i in range(10))
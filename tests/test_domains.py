@@ -0,0 +1,52 @@
+import json
+import os
+
+import pytest
+
+from news_collector.domains import DomainMap, load_domain_map
+
+
+def test_domain_map_params_and_reverse_index():
+    dm = DomainMap({
+        "general": ["chosun.com", "hani.co.kr"],
+        "business": ["biz.chosun.com", "hani.co.kr"],
+        "entertainment": ["sports.chosun.com/entertainment", "Osen.mt.co.kr", "osen.mt.co.kr"],
+    })
+    assert dm.csv("entertainment") == "osen.mt.co.kr,sports.chosun.com/entertainment"
+    assert dm.params("general") == {"domains": "chosun.com,hani.co.kr"}
+    assert dm.csv("health") is None
+
+    assert dm.categorize("https://www.chosun.com/politics/1") == ("general",)
+    assert dm.categorize("https://biz.chosun.com/stock/1") == ("business",)
+    assert dm.categorize("https://sports.chosun.com/entertainment/2") == ("entertainment",)
+    assert dm.categorize("https://sports.chosun.com/baseball/2") == ("general",)
+    assert set(dm.categorize("http://hani.co.kr:8080/a")) == {"general", "business"}
+    assert dm.categorize("https://example.org/") == ()
+
+
+def test_domain_map_validation(tmp_path):
+    p = tmp_path / "dom.json"
+    p.write_text(json.dumps({"tech": ["a.com"], "science": [], "health": ["https://b.com"]}), encoding="utf-8")
+    with pytest.raises(ValueError) as e:
+        DomainMap.from_file(str(p))
+    msg = str(e.value)
+    assert "unknown category: tech" in msg and "science" in msg and "https://b.com" in msg
+
+
+def test_load_domain_map_memoized_and_hot_reloaded(tmp_path):
+    p = tmp_path / "dom.json"
+    p.write_text(json.dumps({"technology": ["zdnet.co.kr"]}), encoding="utf-8")
+    a = load_domain_map(str(p))
+    assert load_domain_map(str(p)) is a
+
+    p.write_text(json.dumps({"technology": ["zdnet.co.kr", "etnews.com"]}), encoding="utf-8")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    b = load_domain_map(str(p))
+    assert b is not a and b.csv("technology") == "etnews.com,zdnet.co.kr"
+
+
+def test_shipped_domains_file_is_valid():
+    path = os.path.join(os.path.dirname(__file__), "..", "kr_domains.json")
+    dm = DomainMap.from_file(path)
+    assert "technology" in dm
@@ -0,0 +1,115 @@
+import datetime as dt
+import json
+import threading
+
+import pytest
+import requests
+from dateutil import tz
+
+from news_collector import cli
+from news_collector.db import SQLiteStorage
+from news_collector.db_firestore import FirestoreStorage
+from news_collector.db_memory import MemoryStorage
+from news_collector.feed import ChangeFeed, FeedStorage, make_server
+from news_collector.loadtest import FakeFirestore
+
+
+def test_sqlite_save_emits_ordered_changes(tmp_path, make_article):
+    st = SQLiteStorage(str(tmp_path / "db.sqlite"), outbox=True)
+    st.open()
+    st.save_many([make_article(1, "technology"), make_article(2, "technology")])
+    st.save_many([make_article(1, "science"), make_article(2, "technology")])  # id2 는 변화 없음 → 이벤트 없음
+
+    events = st.feed.read(after=0)
+    assert [(e["seq"], e["id"], e["op"]) for e in events] == [(1, "id1", "insert"), (2, "id2", "insert"),
+                                                              (3, "id1", "update")]
+    assert st.feed.read(after=2)[0]["category"] == "science"
+    st.close()
+
+
+def test_feed_storage_wraps_other_backends(tmp_path, make_article):
+    st = FeedStorage(MemoryStorage(), ChangeFeed.open(str(tmp_path / "outbox.db")))
+    st.open()
+    assert st.save_many([make_article(1, "technology"), make_article(1, "science")]) == [True, False]
+    assert [e["op"] for e in st.feed.read()] == ["insert", "update"]
+    st.close()
+
+
+@pytest.mark.parametrize("make", [MemoryStorage, lambda: FirestoreStorage(db=FakeFirestore())])
+def test_feed_storage_skips_noop_updates(make, tmp_path, make_article):
+    st = FeedStorage(make(), ChangeFeed.open(str(tmp_path / "outbox.db")))
+    st.open()
+    st.save_many([make_article(1, "technology"), make_article(2, "technology")])
+    # 다음 실행에서 같은 기사를 다시 받아도 categories 가 그대로면 이벤트 없음
+    assert st.save_many([make_article(1, "technology"), make_article(2, "science")]) == [False, False]
+    assert st.merge_categories(["id1", "id2", "nope"], "science") == ["id1"]
+    assert st.merge_categories(["id1"], "science") == []
+    assert [(e["id"], e["op"], e["category"]) for e in st.feed.read()] == [
+        ("id1", "insert", "technology"), ("id2", "insert", "technology"),
+        ("id2", "update", "science"), ("id1", "update", "science")]
+    st.close()
+
+
+def test_serve_changes_and_sse(tmp_path, make_article):
+    db = str(tmp_path / "db.sqlite")
+    st = SQLiteStorage(db, outbox=True)
+    st.open()
+    st.save_many([make_article(i, "technology") for i in range(3)])
+
+    srv = make_server(db, port=0, poll_interval=0.05)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{srv.server_address[1]}"
+    try:
+        r = requests.get(f"{base}/changes", params={"after": 1, "limit": 1}, timeout=5).json()
+        assert [e["id"] for e in r["events"]] == ["id1"] and r["cursor"] == 2
+
+        with requests.get(f"{base}/stream", headers={"Last-Event-ID": "2"}, stream=True, timeout=5) as resp:
+            lines = resp.iter_lines(chunk_size=1, decode_unicode=True)
+            assert next(lines) == "id: 3"
+            assert next(lines) == "event: insert"
+            assert json.loads(next(lines)[len("data: "):])["id"] == "id2"
+            st.save_many([make_article(9, "science")])  # 연결 중에 새로 저장된 것도 흘러나옴
+            nxt = [next(lines) for _ in range(4)]
+            assert nxt[1] == "id: 4" and json.loads(nxt[3][len("data: "):])["id"] == "id9"
+    finally:
+        srv.shutdown()
+        srv.server_close()
+        st.close()
+
+
+def test_sqlite_outbox_is_opt_in_and_pruned_by_compact(tmp_path, make_article):
+    db = str(tmp_path / "db.sqlite")
+    st = SQLiteStorage(db)
+    st.open()
+    st.save_many([make_article(1)])
+    assert st.feed is None
+    assert st.conn.execute("SELECT name FROM sqlite_master WHERE name='outbox'").fetchone() is None
+    st.close()
+
+    st = SQLiteStorage(db, outbox=True)
+    st.open()
+    st.save_many([make_article(2)])
+    st.close()
+    st = SQLiteStorage(db)  # compact 은 outbox=False 로 열어도 기존 outbox 를 정리
+    st.open()
+    st.compact(drop_before=dt.datetime.now(tz=tz.UTC) + dt.timedelta(days=1), strip_before=None, vacuum="none")
+    assert st.conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0] == 0
+    st.close()
+
+
+def test_cli_honours_outbox_for_sqlite(tmp_path, monkeypatch):
+    db = str(tmp_path / "db.sqlite")
+    opened = {}
+
+    def fake_collect(args, api_key, storage, spool, prober):
+        opened["storage"] = storage
+        return {}
+
+    monkeypatch.setenv("NEWSAPI_KEY", "k")
+    monkeypatch.setattr(cli, "collect", fake_collect)
+    cli.main(["--db", db, "--outbox", db])
+    assert isinstance(opened["storage"], SQLiteStorage) and opened["storage"].outbox
+    cli.main(["--db", db, "--outbox", str(tmp_path / "other.db")])
+    assert isinstance(opened["storage"], FeedStorage)
+    cli.main(["--db", db])
+    assert isinstance(opened["storage"], SQLiteStorage) and not opened["storage"].outbox
@@ -0,0 +1,104 @@
+import struct
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from news_collector.images import ImageCache, ImageProber, image_size
+
+
+def _png(w, h):
+    ihdr = struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)
+    chunk = b"IHDR" + ihdr
+    return (b"\x89PNG\r\n\x1a\n" + struct.pack(">I", len(ihdr)) + chunk
+            + struct.pack(">I", zlib.crc32(chunk)) + b"\x00" * 4096)
+
+
+@pytest.fixture
+def image_server():
+    files = {"/a.png": _png(640, 360), "/b.gif": b"GIF89a" + struct.pack("<HH", 20, 10) + b"\x00" * 100}
+    hits = []
+
+    class H(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            body = files.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            rng = self.headers.get("Range")
+            ctype = "image/png" if self.path.endswith(".png") else "image/gif"
+            if rng:
+                start, end = (int(x) for x in rng.split("=")[1].split("-"))
+                part = body[start:end + 1]
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{start + len(part) - 1}/{len(body)}")
+            else:
+                part = body
+                self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(part)))
+            self.end_headers()
+            self.wfile.write(part)
+
+        def log_message(self, *a):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), H)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}", hits, files
+    srv.shutdown()
+
+
+def test_image_size_formats():
+    assert image_size(_png(3, 4)) == (3, 4)
+    assert image_size(b"GIF89a" + struct.pack("<HH", 5, 6)) == (5, 6)
+    jpeg = (b"\xff\xd8" + b"\xff\xe0" + struct.pack(">H", 4) + b"\x00\x00"
+            + b"\xff\xc0" + struct.pack(">HBHH", 11, 8, 30, 40) + b"\x00" * 8)
+    assert image_size(jpeg) == (40, 30)
+    assert image_size(b"not an image") is None
+
+
+def test_enrich_probes_once_per_url(image_server, tmp_path):
+    base, hits, files = image_server
+    items = [
+        {"id": "1", "raw": {"urlToImage": f"{base}/a.png"}},
+        {"id": "2", "raw": {"urlToImage": f"{base}/a.png"}},
+        {"id": "3", "raw": {"urlToImage": f"{base}/missing.jpg"}},
+        {"id": "4", "raw": {"urlToImage": f"{base}/b.gif"}},
+        {"id": "5", "raw": {}},
+    ]
+    prober = ImageProber(max_workers=4, per_host=2, range_bytes=1024, cache=ImageCache(str(tmp_path / "img.db")))
+    assert prober.enrich(items) == 4
+    prober.close()
+
+    assert items[0]["image"] == {"alive": True, "status": 206, "content_type": "image/png",
+                                 "bytes": len(files["/a.png"]), "width": 640, "height": 360}
+    assert items[1]["image"] == items[0]["image"]
+    assert items[2]["image"]["alive"] is False and items[2]["image"]["status"] == 404
+    assert (items[3]["image"]["width"], items[3]["image"]["height"]) == (20, 10)
+    assert "image" not in items[4]
+    assert sorted(hits) == ["/a.png", "/b.gif", "/missing.jpg"]
+
+    # 영속 캐시: 새 프로세스에서도 다시 조회하지 않음
+    again = ImageProber(cache=ImageCache(str(tmp_path / "img.db")))
+    again.enrich([{"id": "9", "raw": {"urlToImage": f"{base}/a.png"}}])
+    again.close()
+    assert len(hits) == 3
+
+
+def test_persistent_cache_loads_only_requested_urls(tmp_path):
+    path = str(tmp_path / "img.db")
+    cache = ImageCache(path)
+    cache.put_many([{"url": f"https://x/{i}.png", "alive": True} for i in range(1200)])
+    cache.close()
+
+    cache = ImageCache(path)
+    assert len(cache) == 0  # 시작 시 테이블 전체를 읽지 않음
+    urls = [f"https://x/{i}.png" for i in range(0, 1200, 2)] + ["https://x/new.png"]
+    found = cache.get_many(urls)
+    assert len(found) == 600 and "https://x/new.png" not in found
+    assert len(cache) == 600
+    cache.close()
@@ -0,0 +1,65 @@
+import datetime as dt
+import os
+import subprocess
+import sys
+
+from dateutil import tz
+
+from news_collector.compact import Budget
+from news_collector.db_firestore import FirestoreStorage
+from news_collector.loadtest import FakeFirestore, FakeNewsAPI, run_loadtest
+
+
+def test_fake_newsapi_pages_and_injects_errors():
+    import requests
+    with FakeNewsAPI(articles_per_query=150, error_rate=1.0, error_codes=[503], max_consecutive_errors=1) as srv:
+        sess = requests.Session()
+        params = {"apiKey": "k", "category": "business", "country": "us", "pageSize": 100, "page": 2}
+        assert sess.get(f"{srv.base_url}/top-headlines", params=params).status_code == 503
+        r = sess.get(f"{srv.base_url}/top-headlines", params=params)
+        assert r.status_code == 200
+        assert len(r.json()["articles"]) == 50
+        rep = srv.report()
+    assert rep["by_status"] == {"200": 1, "503": 1}
+    assert rep["recovered_after_error"] == 1
+    assert rep["connections"] == 1  # keep-alive 재사용
+
+
+def test_firestore_storage_on_fake_firestore(make_article):
+    st = FirestoreStorage(db=FakeFirestore())
+    old = dt.datetime(2025, 6, 1, tzinfo=tz.UTC)
+    assert st.save_many([make_article(1, "tech"), make_article(2, "tech", published=old)]) == [True, True]
+    assert st.save_many([make_article(1, "science")]) == [False]
+    assert st.existing_ids(["id1", "id2", "id3"]) == {"id1", "id2"}
+    assert set(st.db.collection("articles").document("id1").get().to_dict()["categories"]) == {"tech", "science"}
+
+    st.store_topk("tech", [(2.0, "id1"), (1.0, "id2")])
+    assert st.load_topk("tech") == [(2.0, "id1"), (1.0, "id2")]
+
+    now = dt.datetime(2025, 8, 2, tzinfo=tz.UTC)
+    r = st.compact(drop_before=now - dt.timedelta(days=30), strip_before=now, budget=Budget())
+    assert (r["deleted"], r["stripped"], r["complete"]) == (1, 1, True)
+    assert st.existing_ids(["id1", "id2"]) == {"id1"}
+    assert st.load_topk("tech") == [(2.0, "id1")]  # 삭제된 기사는 top-K 에서도 빠짐
+    assert "raw_json" not in st.db.collection("articles").document("id1").get().to_dict()
+
+
+def test_run_loadtest_end_to_end_recovers_from_errors():
+    rep = run_loadtest(runs=3, concurrency=2, store="firestore", categories=["business", "sports"],
+                       page_size=50, max_pages=2, articles_per_query=80, latency_ms=1, jitter_ms=0,
+                       error_rate=0.3, error_codes=[500, 503], max_consecutive_errors=1, retry_backoff=0)
+    assert rep["runs_ok"] == 3 and rep["runs_failed"] == 0
+    srv = rep["server"]
+    injected = sum(n for code, n in srv["by_status"].items() if code != "200")
+    assert injected > 0 and srv["recovered_after_error"] == injected
+    assert rep["stored_articles"] > 0
+    assert srv["connections"] < srv["requests"]
+
+
+def test_fake_newsapi_articles_are_stable_across_processes():
+    code = ("from news_collector.loadtest import FakeNewsAPI; s = FakeNewsAPI(); "
+            "print(s._articles('everything', 'a.com', 'ko', 1, 3)[1]['url']); s.server.server_close()")
+    urls = {subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                           env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+            for seed in ("1", "2")}
+    assert len(urls) == 1
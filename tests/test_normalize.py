@@ -0,0 +1,29 @@
+from news_collector.normalize import clean_text, detect_lang, normalize_batch, truncate_chars
+
+
+def test_clean_text_entities_tags_whitespace():
+    s = "  삼성&amp;LG <b>신제품</b>\n\n 공개&#8230;\u200b&nbsp;끝 "
+    assert clean_text(s) == "삼성&LG 신제품 공개… 끝"
+    assert clean_text(None) == ""
+
+
+def test_truncate_never_splits_combining_or_zwj():
+    assert truncate_chars("abce\u0301f", 4) == "abc"  # e + 결합 악센트
+    family = "hi \U0001F468\u200d\U0001F469\u200d\U0001F467"
+    assert truncate_chars(family, 5) == "hi"
+    assert len(clean_text("가" * 3000, 2000)) == 2000
+
+
+def test_detect_lang():
+    assert detect_lang("삼성전자, 3분기 영업이익 10조 돌파") == "ko"
+    assert detect_lang("Samsung posts record Q3 profit") == "en"
+    assert detect_lang("Samsung 갤럭시 S25 공개") == "ko"
+    assert detect_lang("1234 !!") is None
+
+
+def test_normalize_batch_dedupes_cross_language_results():
+    en = {"id": "x", "title": "삼성 실적 발표", "summary": "", "req_lang": "en"}
+    ko = {"id": "x", "title": "삼성 실적 발표", "summary": "", "req_lang": "ko"}
+    other = {"id": "y", "title": "??", "summary": "", "req_lang": "en"}
+    out = normalize_batch([en, ko, other])
+    assert [(a["id"], a["req_lang"], a["lang"]) for a in out] == [("x", "ko", "ko"), ("y", "en", "en")]
@@ -0,0 +1,41 @@
+import json
+import pstats
+import time
+
+import pytest
+
+from news_collector.collector import collect_categories
+from news_collector.db_memory import MemoryStorage
+from news_collector.profiling import Profiler
+
+
+def _run(monkeypatch, tmp_path):
+    def fake_fetch(api_key, category, country, page_size, max_pages, debug):
+        time.sleep(0.05)
+        return [{"id": str(i), "title": f"t{i}", "url": f"u{i}", "source": "s", "published": None,
+                 "summary": "s" * 100, "category": category, "raw": {}} for i in range(50)]
+
+    monkeypatch.setattr("news_collector.collector.fetch_top_headlines_category", fake_fetch)
+    return collect_categories(["technology", "science"], "us", 100, None, None, 1, "KEY",
+                              str(tmp_path / "out.json"), storage=MemoryStorage())
+
+
+@pytest.mark.parametrize("mode", ["cpu", "mem"])
+def test_profile_modes_write_reports(mode, monkeypatch, tmp_path):
+    out = tmp_path / "prof"
+    with Profiler(mode, str(out), interval=0.002):
+        res = _run(monkeypatch, tmp_path)
+    assert res["science"]["count"] == 50
+
+    stages = json.loads((out / "stages.json").read_text())["stages"]
+    assert set(stages) == {"fetch", "normalize", "filter", "enrich", "save", "export"}
+    assert stages["fetch"]["calls"] == 2 and stages["fetch"]["seconds"] >= 0.1
+
+    if mode == "cpu":
+        assert pstats.Stats(str(out / "cpu.pstats")).total_calls > 0
+        lines = (out / "cpu.collapsed").read_text().splitlines()
+        assert any(l.startswith("stage:fetch;") and "fake_fetch" in l for l in lines)
+        assert all(l.rsplit(" ", 1)[1].isdigit() for l in lines)
+    else:
+        report = (out / "mem_top.txt").read_text()
+        assert "== stage normalize" in report and "== live at end" in report
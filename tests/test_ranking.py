@@ -0,0 +1,61 @@
+import datetime as dt
+
+from dateutil import tz
+
+from news_collector.db import SQLiteStorage
+from news_collector.ranking import Scorer, duplicate_counts, merge_topk
+
+NOW = dt.datetime(2025, 9, 1, 12, tzinfo=tz.UTC)
+
+
+def _ago(hours):
+    return NOW - dt.timedelta(hours=hours) if hours is not None else None
+
+
+def test_rank_combines_recency_source_dups_and_lang(make_article):
+    sc = Scorer(half_life_hours=12, source_weights={"Big": 2.0}, lang_weights={"en": 0.5})
+    items = [
+        make_article(1, published=_ago(1)),
+        make_article(2, published=_ago(12), source="Big"),  # 한 반감기 전이지만 가중치 2배 → 방금 기사와 동급 이상
+        make_article(3, published=_ago(30), title="title 3"),
+        make_article(4, published=_ago(31), source="Other", title="Title 3 - Other"),  # id3 과 교차 출처 중복
+        make_article(5, published=_ago(0), lang="en"),
+        make_article(6, published=None),  # 날짜 없음 → 48시간 전으로 취급
+        make_article(1, published=_ago(1)),  # 같은 id 는 한 번만
+    ]
+    ranked = sc.rank(items, now=NOW)
+    assert [a["id"] for a in ranked] == ["id2", "id1", "id5", "id3", "id4", "id6"]
+    assert duplicate_counts(items)["title3"] == 2
+
+
+def test_score_key_is_time_invariant(make_article):
+    sc = Scorer()
+    a, b = make_article(1, published=_ago(5)), make_article(2, published=_ago(20), source="x")
+    later = NOW + dt.timedelta(days=3)
+    assert sc.score(a, now=NOW) == sc.score(a, now=later)
+    assert (sc.score(a, now=NOW) > sc.score(b, now=NOW)) == (sc.score(a, now=later) > sc.score(b, now=later))
+
+
+def test_topk_persists_across_runs(tmp_path):
+    st = SQLiteStorage(str(tmp_path / "db.sqlite"))
+    st.open()
+    st.store_topk("technology", merge_topk([], [(1.0, "a"), (3.0, "b"), (2.0, "c")], k=2))
+    assert st.load_topk("technology") == [(3.0, "b"), (2.0, "c")]
+
+    # 다음 실행: 기존 힙 + 새 후보, 같은 id 는 높은 점수로
+    merged = merge_topk(st.load_topk("technology"), [(2.5, "d"), (4.0, "c"), (0.5, "e")], k=2)
+    st.store_topk("technology", merged)
+    assert st.load_topk("technology") == [(4.0, "c"), (3.0, "b")]
+    assert st.load_topk("science") == []
+    st.close()
+
+
+def test_undated_articles_stay_out_of_persistent_topk(make_article):
+    from news_collector.collector import _update_topk
+    from news_collector.db_memory import MemoryStorage
+    st = MemoryStorage()
+    sc = Scorer()
+    for run in range(3):  # 날짜 없는 기사는 매 실행 점수가 커지므로 힙에 들어가면 계속 올라감
+        items = sc.rank([make_article(1, published=_ago(1)), make_article(2, published=None)], now=NOW + dt.timedelta(days=run))
+        _update_topk("technology", items, st, top_k=5, debug=False)
+    assert [i for _, i in st.load_topk("technology")] == ["id1"]
@@ -0,0 +1,114 @@
+import multiprocessing
+
+import pytest
+
+from news_collector.db import SQLiteStorage
+from news_collector.db_memory import MemoryStorage
+from news_collector.spool import Spool, SpoolBusy
+
+
+def test_spool_survives_crash_and_replays(tmp_path, make_article):
+    spool_dir = tmp_path / "spool"
+    sp = Spool(str(spool_dir), fsync_every=2)
+    sp.extend([make_article(i) for i in range(5)])
+
+    # 저장 도중 죽음 → 커밋된 위치 이후만 남아야 함
+    class Flaky(MemoryStorage):
+        def save_many(self, items):
+            if len(self.articles) == 3:
+                raise RuntimeError("firestore timeout")
+            return super().save_many(items)
+
+    try:
+        sp.drain(Flaky(), batch_size=1)
+    except RuntimeError:
+        pass
+    sp.close()
+
+    # 쓰다 만 레코드(개행 없음)는 무시
+    seg = sorted(spool_dir.glob("seg-*.jsonl"))[-1]
+    with open(seg, "ab") as f:
+        f.write(b'{"id": "partial"')
+
+    st = SQLiteStorage(str(tmp_path / "db.sqlite"))
+    st.open()
+    res = Spool(str(spool_dir)).drain(st)
+    assert res == {"saved": 2, "skipped": 0, "count": 2, "corrupt": 0}
+    ids = {r[0] for r in st.conn.execute("SELECT id FROM articles")}
+    assert ids == {"id3", "id4"}
+    assert len(Spool(str(spool_dir))) == 0
+
+
+def test_spool_rolls_segments_and_cleans_up(tmp_path, make_article):
+    sp = Spool(str(tmp_path), segment_bytes=200)
+    sp.extend([make_article(i) for i in range(6)])
+    assert len(list(tmp_path.glob("seg-*.jsonl"))) > 1
+    st = MemoryStorage()
+    sp.drain(st, batch_size=4)
+    sp.close()
+    assert list(st.articles) == [f"id{i}" for i in range(6)]
+    assert len(list(tmp_path.glob("seg-*.jsonl"))) == 1
+
+
+def test_spool_append_after_torn_write(tmp_path, make_article):
+    sp = Spool(str(tmp_path))
+    sp.extend([make_article(0)])
+    sp.close()
+    seg = sorted(tmp_path.glob("seg-*.jsonl"))[-1]
+    with open(seg, "ab") as f:
+        f.write(b'{"id": "torn"')
+
+    sp = Spool(str(tmp_path))
+    sp.extend([make_article(1)])
+    assert [a["id"] for _, _, a in sp.pending()] == ["id0", "id1"]
+    sp.close()
+
+
+def _hold_lock(path, ready, release):
+    sp = Spool(path)
+    with sp._consumer_lock(blocking=False):
+        ready.set()
+        release.wait(10)
+
+
+def test_drain_fails_fast_while_another_process_drains(tmp_path, make_article):
+    sp = Spool(str(tmp_path))
+    sp.extend([make_article(0)])
+    ctx = multiprocessing.get_context("fork")
+    ready, release = ctx.Event(), ctx.Event()
+    proc = ctx.Process(target=_hold_lock, args=(str(tmp_path), ready, release))
+    proc.start()
+    try:
+        assert ready.wait(10)
+        with pytest.raises(SpoolBusy):
+            sp.drain(MemoryStorage())
+    finally:
+        release.set()
+        proc.join(10)
+    assert sp.drain(MemoryStorage())["count"] == 1
+    sp.close()
+
+
+def test_commit_never_moves_cursor_backwards(tmp_path, make_article):
+    sp = Spool(str(tmp_path), segment_bytes=100)
+    sp.extend([make_article(i) for i in range(4)])
+    positions = [(seg, off) for seg, off, _ in sp.pending()]
+    sp.commit(*positions[-1])
+    sp.commit(*positions[0])  # 늦게 도착한 다른 소비자의 커밋
+    assert list(sp.pending()) == []
+    sp.close()
+
+
+def test_pending_counts_corrupt_lines(tmp_path, make_article, capsys):
+    sp = Spool(str(tmp_path))
+    sp.extend([make_article(0)])
+    sp.close()
+    seg = sorted(tmp_path.glob("seg-*.jsonl"))[-1]
+    with open(seg, "ab") as f:
+        f.write(b'{"id": broken}\n')
+    sp = Spool(str(tmp_path))
+    sp.extend([make_article(1)])
+    res = sp.drain(MemoryStorage())
+    assert (res["count"], res["corrupt"]) == (2, 1)
+    assert "undecodable record" in capsys.readouterr().err
+    sp.close()
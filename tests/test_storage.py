@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from news_collector.db import SQLiteStorage
+from news_collector.db_memory import MemoryStorage
+from news_collector.storage import AsyncStorageAdapter, CallbackStorage, Storage
+
+
+def _sqlite(tmp_path):
+    return SQLiteStorage(str(tmp_path / "db.sqlite"))
+
+
+@pytest.mark.parametrize("make", [_sqlite, lambda tmp_path: MemoryStorage()])
+def test_save_many_and_merge(make, tmp_path, make_article):
+    st = make(tmp_path)
+    st.open()
+    assert isinstance(st, Storage)
+
+    # 같은 배치 안의 중복 id 도 기존 기사로 취급
+    batch = [make_article(1, "technology"), make_article(2, "technology"), make_article(1, "science")]
+    assert st.save_many(batch) == [True, True, False]
+    assert st.save_many([make_article(2, "business"), make_article(3, "business")]) == [False, True]
+    assert st.existing_ids(["id1", "id2", "id3", "nope"]) == {"id1", "id2", "id3"}
+
+    st.merge_categories(["id3", "nope"], "health")
+    if isinstance(st, SQLiteStorage):
+        cats = dict(st.conn.execute("SELECT id, categories FROM articles").fetchall())
+        assert cats == {"id1": "science,technology", "id2": "business,technology", "id3": "business,health"}
+    else:
+        assert st.articles["id3"]["categories"] == ["business", "health"]
+    st.close()
+
+
+def test_async_adapter_runs_sqlite_on_worker_thread(tmp_path, make_article):
+    async def run():
+        st = AsyncStorageAdapter(_sqlite(tmp_path))
+        await st.open()
+        flags = await asyncio.gather(st.save_many([make_article(1, "technology")]),
+                                     st.save_many([make_article(1, "science")]))
+        ids = await st.existing_ids(["id1", "id2"])
+        await st.close()
+        return flags, ids
+
+    flags, ids = asyncio.run(run())
+    assert sorted(flags) == [[False], [True]]
+    assert ids == {"id1"}
+
+
+def test_callback_storage_merges_categories_through_save_fn(tmp_path, make_article):
+    from news_collector.db import connect_db, save_article
+    conn = connect_db(str(tmp_path / "db.sqlite"))
+    st = CallbackStorage(save_article, conn)
+    assert isinstance(st, Storage)
+    assert st.save_many([make_article(1, "technology")]) == [True]
+
+    st.merge_categories(["id1", "nope"], "science")
+    assert conn.execute("SELECT id, categories FROM articles").fetchall() == [("id1", "science,technology")]
+    conn.close()